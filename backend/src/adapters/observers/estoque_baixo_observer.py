@@ -3,10 +3,15 @@ Observer: Estoque Baixo
 Reage quando estoque fica crítico
 """
 
+import logging
+
 from src.domain.events import EstoqueBaixoEvent
 from .base_observer import BaseObserver
 
 
+logger = logging.getLogger(__name__)
+
+
 class EstoqueBaixoObserver(BaseObserver):
     """
     Observer que reage a estoque baixo
@@ -18,23 +23,44 @@ class EstoqueBaixoObserver(BaseObserver):
     - Poderia enviar SMS (futuro)
     """
     
+    # Template do alerta montado UMA vez, na importação da classe —
+    # em runtime só resta preencher os campos com .format()
+    _SEPARADOR = "=" * 60
+    _TEMPLATE = "\n".join([
+        "",
+        _SEPARADOR,
+        "{nivel} - ESTOQUE BAIXO DETECTADO!",
+        _SEPARADOR,
+        "📦 Produto: {produto}",
+        "📊 Estoque atual: {estoque_atual} unidades",
+        "📊 Estoque mínimo: {estoque_minimo} unidades",
+        "📉 Faltam: {diferenca} unidades",
+        "📊 Nível: {percentual:.1f}% do mínimo",
+        "👤 Notificando: {gerente}",
+        "⏰ Quando: {quando}",
+        _SEPARADOR,
+        "💡 AÇÃO SUGERIDA: Solicitar reposição imediata!",
+        _SEPARADOR,
+        ""
+    ])
+
     def __init__(self, nome_gerente: str = "Gerente"):
         self.nome_gerente = nome_gerente
     
-    def notificar(self, evento: EstoqueBaixoEvent):
+    def _montar_alerta(self, evento: EstoqueBaixoEvent) -> str:
         """
-        Reage ao evento de estoque baixo
-        
+        Monta o bloco de alerta de um evento (sem emitir)
+
         Args:
             evento: EstoqueBaixoEvent com dados do estoque
+
+        Returns:
+            Bloco de alerta formatado
         """
-        # Extrair dados do evento
-        dados = evento.to_dict()
-        
         # Calcular urgência
         diferenca = evento.estoque_minimo - evento.estoque_atual
         percentual = (evento.estoque_atual / evento.estoque_minimo) * 100
-        
+
         # Determinar nível de alerta
         if percentual <= 20:
             nivel = "🚨 CRÍTICO"
@@ -42,27 +68,52 @@ class EstoqueBaixoObserver(BaseObserver):
             nivel = "⚠️ URGENTE"
         else:
             nivel = "⚡ ATENÇÃO"
-        
-        # Imprimir alerta
-        print("\n" + "="*60)
-        print(f"{nivel} - ESTOQUE BAIXO DETECTADO!")
-        print("="*60)
-        print(f"📦 Produto: {evento.nome_medicamento}")
-        print(f"📊 Estoque atual: {evento.estoque_atual} unidades")
-        print(f"📊 Estoque mínimo: {evento.estoque_minimo} unidades")
-        print(f"📉 Faltam: {diferenca} unidades")
-        print(f"📊 Nível: {percentual:.1f}% do mínimo")
-        print(f"👤 Notificando: {self.nome_gerente}")
-        print(f"⏰ Quando: {evento.timestamp.strftime('%d/%m/%Y %H:%M:%S')}")
-        print("="*60)
-        print("💡 AÇÃO SUGERIDA: Solicitar reposição imediata!")
-        print("="*60 + "\n")
-        
+
+        return self._TEMPLATE.format(
+            nivel=nivel,
+            produto=evento.nome_medicamento,
+            estoque_atual=evento.estoque_atual,
+            estoque_minimo=evento.estoque_minimo,
+            diferenca=diferenca,
+            percentual=percentual,
+            gerente=self.nome_gerente,
+            quando=self._formatar_timestamp(evento.timestamp)
+        )
+
+    def notificar(self, evento: EstoqueBaixoEvent):
+        """
+        Reage ao evento de estoque baixo
+
+        Args:
+            evento: EstoqueBaixoEvent com dados do estoque
+        """
+        # Preencher o template pré-montado e emitir UMA vez só
+        # (1 chamada de I/O em vez de ~13 prints por alerta)
+        logger.info(self._montar_alerta(evento))
+
         # Aqui você poderia:
         # - Enviar email: self._enviar_email(evento)
         # - Enviar SMS: self._enviar_sms(evento)
         # - Criar tarefa: self._criar_tarefa(evento)
-    
+
+    def notificar_em_lote(self, eventos):
+        """
+        Reage a uma rajada de eventos de estoque baixo
+
+        Monta TODOS os blocos em memória e emite numa única
+        escrita de log: 1 chamada de I/O pra N alertas!
+
+        Args:
+            eventos: Lista de EstoqueBaixoEvent
+        """
+        if not eventos:
+            return
+
+        logger.info("".join(
+            self._montar_alerta(evento) for evento in eventos
+        ))
+
+
     # Métodos futuros (comentados por enquanto)
     # def _enviar_email(self, evento):
     #     """Envia email pro gerente"""
@@ -3,10 +3,15 @@ Observer: Produto Vencendo
 Reage quando produto está perto de vencer
 """
 
+import logging
+
 from src.domain.events import ProdutoVencendoEvent
 from .base_observer import BaseObserver
 
 
+logger = logging.getLogger(__name__)
+
+
 class ProdutoVencendoObserver(BaseObserver):
     """
     Observer que reage a produtos vencendo
@@ -18,6 +23,24 @@ class ProdutoVencendoObserver(BaseObserver):
     - Poderia criar desconto automático (futuro)
     """
     
+    # Template do alerta montado UMA vez, na importação da classe —
+    # em runtime só resta preencher os campos com .format()
+    _SEPARADOR = "=" * 60
+    _TEMPLATE = "\n".join([
+        "",
+        _SEPARADOR,
+        "{nivel} - PRODUTO VENCENDO!",
+        _SEPARADOR,
+        "💊 Produto: {produto}",
+        "📦 Lote: {lote}",
+        "📅 Validade: {validade}",
+        "⏰ Vence em: {dias} dias",
+        "📊 Quantidade: {quantidade} unidades",
+        "⏰ Quando: {quando}",
+        _SEPARADOR,
+        "💡 AÇÃO SUGERIDA: {acao}",
+    ])
+
     def __init__(self, dias_alerta_critico: int = 7):
         """
         Args:
@@ -25,12 +48,15 @@ class ProdutoVencendoObserver(BaseObserver):
         """
         self.dias_alerta_critico = dias_alerta_critico
     
-    def notificar(self, evento: ProdutoVencendoEvent):
+    def _montar_alerta(self, evento: ProdutoVencendoEvent) -> str:
         """
-        Reage ao evento de produto vencendo
-        
+        Monta o bloco de alerta de um evento (sem emitir)
+
         Args:
             evento: ProdutoVencendoEvent com dados
+
+        Returns:
+            Bloco de alerta formatado
         """
         # Determinar urgência
         if evento.dias_ate_vencer <= self.dias_alerta_critico:
@@ -43,31 +69,60 @@ class ProdutoVencendoObserver(BaseObserver):
             nivel = "⚡ ATENÇÃO"
             acao = "Monitorar de perto"
         
-        # Imprimir alerta
-        print("\n" + "="*60)
-        print(f"{nivel} - PRODUTO VENCENDO!")
-        print("="*60)
-        print(f"💊 Produto: {evento.nome_medicamento}")
-        print(f"📦 Lote: {evento.numero_lote}")
-        print(f"📅 Validade: {evento.data_validade}")
-        print(f"⏰ Vence em: {evento.dias_ate_vencer} dias")
-        print(f"📊 Quantidade: {evento.quantidade} unidades")
-        print(f"⏰ Quando: {evento.timestamp.strftime('%d/%m/%Y %H:%M:%S')}")
-        print("="*60)
-        print(f"💡 AÇÃO SUGERIDA: {acao}")
-        
+        # Preencher o template pré-montado e emitir UMA vez só
+        # (1 chamada de I/O em vez de ~13 prints por alerta)
+        alerta = self._TEMPLATE.format(
+            nivel=nivel,
+            produto=evento.nome_medicamento,
+            lote=evento.numero_lote,
+            validade=evento.data_validade,
+            dias=evento.dias_ate_vencer,
+            quantidade=evento.quantidade,
+            quando=self._formatar_timestamp(evento.timestamp),
+            acao=acao
+        )
+
         # Se crítico, dar sugestão de desconto
         if evento.dias_ate_vencer <= self.dias_alerta_critico:
             desconto_sugerido = min(50, evento.dias_ate_vencer * 5)
-            print(f"💰 DESCONTO SUGERIDO: {desconto_sugerido}% OFF")
-        
-        print("="*60 + "\n")
-        
+            alerta += f"\n💰 DESCONTO SUGERIDO: {desconto_sugerido}% OFF"
+
+        return alerta + "\n" + self._SEPARADOR + "\n"
+
+    def notificar(self, evento: ProdutoVencendoEvent):
+        """
+        Reage ao evento de produto vencendo
+
+        Args:
+            evento: ProdutoVencendoEvent com dados
+        """
+        # Preencher o template pré-montado e emitir UMA vez só
+        # (1 chamada de I/O em vez de ~13 prints por alerta)
+        logger.info(self._montar_alerta(evento))
+
         # Aqui você poderia:
         # - Criar promoção automática
         # - Avisar vendedores
         # - Marcar no sistema
-    
+
+    def notificar_em_lote(self, eventos):
+        """
+        Reage a uma rajada de eventos de produto vencendo
+
+        Monta TODOS os blocos em memória e emite numa única
+        escrita de log: 1 chamada de I/O pra N alertas!
+
+        Args:
+            eventos: Lista de ProdutoVencendoEvent
+        """
+        if not eventos:
+            return
+
+        logger.info("".join(
+            self._montar_alerta(evento) for evento in eventos
+        ))
+
+
     # Métodos futuros (comentados por enquanto)
     # def _criar_promocao(self, evento):
     #     """Cria promoção automática"""
@@ -6,7 +6,8 @@ ATENÇÃO: Quando o programa encerra, os dados são perdidos!
 Isso é apenas para testes. Nas próximas aulas faremos com banco real.
 """
 
-from typing import Optional, List
+from bisect import bisect_left, insort
+from typing import Iterator, Optional, List
 from datetime import date, timedelta
 from src.domain.entities import Lote
 from src.domain.ports import LoteRepositoryPort
@@ -19,19 +20,78 @@ class LoteRepositoryMemory(LoteRepositoryPort):
     Armazena lotes em um dicionário Python (RAM)
     Quando o programa fecha, perde tudo!
     """
-    
+
+    # __slots__: sem __dict__ por instância — acesso a atributo
+    # mais rápido e menos memória no caminho quente de leitura
+    __slots__ = (
+        "_lotes",
+        "_proximo_id",
+        "_por_medicamento",
+        "_por_validade",
+        "_por_fabricacao",
+    )
+
     def __init__(self):
         """Inicializa o repositório vazio"""
         self._lotes: dict[int, Lote] = {}
         self._proximo_id = 1
-    
+
+        # Índice secundário: medicamento_id -> {id do lote: Lote}
+        # Evita varrer TODOS os lotes em buscar_por_medicamento!
+        # (dict preserva a ordem de inserção, igual à listagem antiga)
+        self._por_medicamento: dict[int, dict[int, Lote]] = {}
+
+        # Índice ordenado por validade: lista de (data_validade, id)
+        # Permite achar "lotes vencendo até dia X" com busca binária!
+        self._por_validade: list[tuple[date, int]] = []
+
+        # Índice FIFO: por medicamento, lista de (data_fabricacao, id)
+        # mantida ordenada com insort — buscar_disponiveis_fifo sai
+        # na ordem certa sem sort nenhum na consulta!
+        self._por_fabricacao: dict[int, list[tuple[date, int]]] = {}
+
+    def _indexar(self, lote: Lote):
+        """Adiciona o lote nos índices secundários"""
+        self._por_medicamento.setdefault(lote.medicamento_id, {})[lote.id] = lote
+        insort(self._por_validade, (lote.data_validade, lote.id))
+        insort(
+            self._por_fabricacao.setdefault(lote.medicamento_id, []),
+            (lote.data_fabricacao, lote.id)
+        )
+
+    def _desindexar(self, lote: Lote):
+        """Remove o lote dos índices secundários"""
+        bucket = self._por_medicamento.get(lote.medicamento_id)
+        if bucket is not None:
+            bucket.pop(lote.id, None)
+
+        try:
+            self._por_validade.remove((lote.data_validade, lote.id))
+        except ValueError:
+            # data_validade mudou por fora? Remove pelo id mesmo
+            self._por_validade = [
+                entrada for entrada in self._por_validade
+                if entrada[1] != lote.id
+            ]
+
+        fila = self._por_fabricacao.get(lote.medicamento_id)
+        if fila is not None:
+            try:
+                fila.remove((lote.data_fabricacao, lote.id))
+            except ValueError:
+                # data_fabricacao mudou por fora? Remove pelo id mesmo
+                fila[:] = [
+                    entrada for entrada in fila
+                    if entrada[1] != lote.id
+                ]
+
     def salvar(self, lote: Lote) -> Lote:
         """
         Salva lote na memória
-        
+
         Args:
             lote: Lote a ser salvo
-            
+
         Returns:
             Lote salvo (com ID gerado)
         """
@@ -39,10 +99,16 @@ class LoteRepositoryMemory(LoteRepositoryPort):
         if lote.id is None:
             lote.id = self._proximo_id
             self._proximo_id += 1
-        
-        # Salva no dicionário
+
+        # Se está sobrescrevendo, tira a versão antiga do índice
+        anterior = self._lotes.get(lote.id)
+        if anterior is not None:
+            self._desindexar(anterior)
+
+        # Salva no dicionário e atualiza o índice
         self._lotes[lote.id] = lote
-        
+        self._indexar(lote)
+
         return lote
     
     def buscar_por_id(self, id: int) -> Optional[Lote]:
@@ -65,22 +131,75 @@ class LoteRepositoryMemory(LoteRepositoryPort):
             Lista de todos os lotes cadastrados
         """
         return list(self._lotes.values())
-    
+
+    def iterar_todos(self) -> Iterator[Lote]:
+        """
+        Itera sobre todos os lotes SEM copiar
+
+        Devolve um iterador direto sobre a view do dicionário:
+        zero alocação de lista, não importa quantos lotes existam.
+        Quem só percorre uma vez não paga o list() do listar_todos!
+        """
+        return iter(self._lotes.values())
+
     def buscar_por_medicamento(self, medicamento_id: int) -> List[Lote]:
         """
         Busca todos os lotes de um medicamento específico
-        
+
+        Complexidade: O(nº de lotes DESTE medicamento) — o índice
+        secundário dispensa o filtro linear sobre o repositório todo.
+
         Args:
             medicamento_id: ID do medicamento
-            
+
         Returns:
             Lista de lotes do medicamento
         """
-        return [
-            lote for lote in self._lotes.values()
-            if lote.medicamento_id == medicamento_id
-        ]
+        # Consulta o índice secundário: O(lotes do medicamento)
+        # em vez de varrer o repositório inteiro
+        bucket = self._por_medicamento.get(medicamento_id)
+        if bucket is None:
+            return []
+        return list(bucket.values())
     
+    def buscar_disponiveis_fifo(self, medicamento_id: int) -> List[Lote]:
+        """
+        Busca lotes disponíveis em ordem FIFO (memória)
+
+        O índice _por_fabricacao já está ordenado (insort na
+        escrita), então a consulta só percorre e filtra —
+        zero sort, igual ao index scan do Postgres!
+
+        Args:
+            medicamento_id: ID do medicamento
+
+        Returns:
+            Lotes disponíveis, do mais antigo pro mais novo
+        """
+        fila = self._por_fabricacao.get(medicamento_id)
+        if not fila:
+            return []
+
+        # Poda preguiçosa: lote esgotado sai da fila na passada —
+        # saídas FIFO repetidas não re-escaneiam o prefixo já
+        # consumido (o mesmo papel do índice parcial quantidade > 0
+        # no Postgres!). Se o lote ganhar estoque de novo,
+        # atualizar() reindexa e ele reentra na fila.
+        disponiveis = []
+        restantes = []
+        for entrada in fila:
+            lote = self._lotes[entrada[1]]
+            if lote.quantidade == 0:
+                continue
+            restantes.append(entrada)
+            if not lote.esta_vencido():
+                disponiveis.append(lote)
+
+        if len(restantes) != len(fila):
+            fila[:] = restantes
+
+        return disponiveis
+
     def listar_vencendo_em(self, dias: int) -> List[Lote]:
         """
         Lista lotes que vencem nos próximos X dias
@@ -91,13 +210,15 @@ class LoteRepositoryMemory(LoteRepositoryPort):
         Returns:
             Lista de lotes que vencem nos próximos X dias
         """
-        data_limite = date.today() + timedelta(days=dias)
-        
-        return [
-            lote for lote in self._lotes.values()
-            if lote.data_validade <= data_limite
-            and lote.data_validade >= date.today()  # Não incluir vencidos
-        ]
+        hoje = date.today()
+        data_limite = hoje + timedelta(days=dias)
+
+        # Busca binária no índice ordenado: acha a janela
+        # [hoje, data_limite] sem olhar lote por lote
+        inicio = bisect_left(self._por_validade, (hoje,))  # Não incluir vencidos
+        fim = bisect_left(self._por_validade, (data_limite + timedelta(days=1),))
+
+        return [self._lotes[id] for _, id in self._por_validade[inicio:fim]]
     
     def atualizar(self, lote: Lote) -> Lote:
         """
@@ -115,10 +236,16 @@ class LoteRepositoryMemory(LoteRepositoryPort):
         if lote.id is None:
             raise ValueError("Lote precisa ter ID para atualizar!")
         
-        if lote.id not in self._lotes:
+        # EAFP: tenta pegar direto — o caso comum é o lote existir
+        try:
+            anterior = self._lotes[lote.id]
+        except KeyError:
             raise ValueError(f"Lote {lote.id} não encontrado!")
-        
+
+        # Reindexar (o medicamento_id pode ter mudado!)
+        self._desindexar(anterior)
         self._lotes[lote.id] = lote
+        self._indexar(lote)
         return lote
     
     def deletar(self, id: int) -> bool:
@@ -131,7 +258,11 @@ class LoteRepositoryMemory(LoteRepositoryPort):
         Returns:
             True se deletou, False se não encontrou
         """
-        if id in self._lotes:
-            del self._lotes[id]
-            return True
-        return False
\ No newline at end of file
+        # EAFP: pop resolve lookup + remoção numa operação só
+        try:
+            lote = self._lotes.pop(id)
+        except KeyError:
+            return False
+
+        self._desindexar(lote)
+        return True
\ No newline at end of file
@@ -5,8 +5,9 @@ Implementa LoteRepositoryPort salvando no banco real
 Agora os dados persistem! 🎉
 """
 
-from typing import Optional, List
+from typing import Iterator, Optional, List
 from datetime import date, timedelta
+from sqlalchemy import case, delete, func, insert, select, update
 from sqlalchemy.orm import Session
 
 from src.domain.entities import Lote
@@ -31,7 +32,8 @@ class LoteRepositoryPostgres(LoteRepositoryPort):
         """
         self.session = session
     
-    def _entidade_para_modelo(self, lote: Lote) -> LoteModel:
+    @staticmethod
+    def _entidade_para_modelo(lote: Lote) -> LoteModel:
         """
         Converte Entidade → Modelo (Domain → Database)
         
@@ -51,7 +53,31 @@ class LoteRepositoryPostgres(LoteRepositoryPort):
             fornecedor=lote.fornecedor
         )
     
-    def _modelo_para_entidade(self, modelo: LoteModel) -> Lote:
+    @staticmethod
+    def _entidade_para_valores(lote: Lote) -> dict:
+        """
+        Converte Entidade → dict de valores (pra INSERT em lote)
+
+        Mesmo mapeamento de campos do _entidade_para_modelo,
+        mas emite dict puro (sem passar pela unit-of-work do ORM)
+
+        Args:
+            lote: Entidade do domínio
+
+        Returns:
+            Dicionário coluna → valor
+        """
+        return {
+            "numero_lote": lote.numero_lote,
+            "medicamento_id": lote.medicamento_id,
+            "quantidade": lote.quantidade,
+            "data_fabricacao": lote.data_fabricacao,
+            "data_validade": lote.data_validade,
+            "fornecedor": lote.fornecedor
+        }
+
+    @staticmethod
+    def _modelo_para_entidade(modelo: LoteModel) -> Lote:
         """
         Converte Modelo → Entidade (Database → Domain)
         
@@ -84,14 +110,46 @@ class LoteRepositoryPostgres(LoteRepositoryPort):
         # Converte entidade → modelo
         lote_model = self._entidade_para_modelo(lote)
         
-        # Salva no banco
+        # Salva no banco — flush() manda o INSERT e pega o ID gerado,
+        # mas o commit (fsync!) fica pro fim do request (ver get_session)
         self.session.add(lote_model)
-        self.session.commit()
-        self.session.refresh(lote_model)  # Pega ID gerado
+        self.session.flush()
         
         # Converte modelo → entidade
         return self._modelo_para_entidade(lote_model)
-    
+
+    def salvar_em_lote(self, lotes: List[Lote]) -> List[Lote]:
+        """
+        Salva vários lotes num ÚNICO INSERT
+
+        Em vez de 1 round-trip por lote (add + commit + refresh),
+        monta um INSERT ... RETURNING id com todas as linhas.
+        Pra importações em massa, a latência de rede é paga 1 vez só!
+
+        Args:
+            lotes: Lista de lotes a salvar
+
+        Returns:
+            Lista de lotes salvos (com IDs gerados pelo banco)
+        """
+        if not lotes:
+            return []
+
+        # Um único INSERT com todas as linhas
+        resultado = self.session.execute(
+            insert(LoteModel)
+            .values([self._entidade_para_valores(lote) for lote in lotes])
+            .returning(LoteModel.id)
+        )
+        ids_gerados = resultado.scalars().all()
+
+        # Preenche os IDs gerados (mesma ordem do INSERT)
+        # O commit fica pro fim do request (ver get_session)
+        for lote, novo_id in zip(lotes, ids_gerados):
+            lote.id = novo_id
+
+        return lotes
+
     def buscar_por_id(self, id: int) -> Optional[Lote]:
         """
         Busca lote por ID no PostgreSQL
@@ -102,13 +160,13 @@ class LoteRepositoryPostgres(LoteRepositoryPort):
         Returns:
             Lote encontrado ou None
         """
-        lote_model = self.session.query(LoteModel).filter(
-            LoteModel.id == id
-        ).first()
-        
+        # session.get busca direto pela chave primária e ainda
+        # aproveita o identity map (objeto já carregado = zero SQL!)
+        lote_model = self.session.get(LoteModel, id)
+
         if lote_model is None:
             return None
-        
+
         return self._modelo_para_entidade(lote_model)
     
     def listar_todos(self) -> List[Lote]:
@@ -118,13 +176,48 @@ class LoteRepositoryPostgres(LoteRepositoryPort):
         Returns:
             Lista de todos os lotes
         """
-        lotes_model = self.session.query(LoteModel).all()
-        
+        # Select de colunas (Core): cada linha vem como named tuple,
+        # sem custo de montar instância ORM nem de identity map.
+        # A linha tem os mesmos atributos do modelo, então a conversão
+        # pra entidade é a mesma!
+        linhas = self.session.execute(
+            select(
+                LoteModel.id,
+                LoteModel.numero_lote,
+                LoteModel.medicamento_id,
+                LoteModel.quantidade,
+                LoteModel.data_fabricacao,
+                LoteModel.data_validade,
+                LoteModel.fornecedor
+            )
+        )
+
         return [
-            self._modelo_para_entidade(modelo)
-            for modelo in lotes_model
+            self._modelo_para_entidade(linha)
+            for linha in linhas
         ]
-    
+
+    def iterar_todos(self) -> Iterator[Lote]:
+        """
+        Itera sobre todos os lotes via cursor streaming
+
+        yield_per vai na OPÇÃO DE EXECUÇÃO do select (não no
+        Result já executado!): é isso que liga stream_results e o
+        cursor do lado do servidor — as linhas chegam em páginas
+        de 1000 e a memória fica constante, em vez de materializar
+        a tabela inteira como listar_todos() faz. Ideal pra
+        exportações e varreduras em tabelas grandes!
+
+        Returns:
+            Iterador de lotes
+        """
+        resultado = self.session.execute(
+            select(LoteModel).execution_options(yield_per=1000)
+        ).scalars()
+
+        for modelo in resultado:
+            yield self._modelo_para_entidade(modelo)
+
     def buscar_por_medicamento(self, medicamento_id: int) -> List[Lote]:
         """
         Busca lotes de um medicamento no PostgreSQL
@@ -143,7 +236,57 @@ class LoteRepositoryPostgres(LoteRepositoryPort):
             self._modelo_para_entidade(modelo)
             for modelo in lotes_model
         ]
-    
+
+    def somar_quantidade_por_medicamento(self, medicamento_id: int) -> int:
+        """
+        Soma a quantidade em estoque direto no PostgreSQL
+
+        SELECT SUM(quantidade): o banco agrega e devolve UM escalar —
+        nada de buscar N lotes, hidratar N objetos ORM e somar em
+        Python só pra jogar tudo fora em seguida!
+
+        Args:
+            medicamento_id: ID do medicamento
+
+        Returns:
+            Quantidade total somada (0 se não houver lotes)
+        """
+        return self.session.execute(
+            select(func.coalesce(func.sum(LoteModel.quantidade), 0))
+            .where(LoteModel.medicamento_id == medicamento_id)
+        ).scalar_one()
+
+    def buscar_disponiveis_fifo(self, medicamento_id: int) -> List[Lote]:
+        """
+        Busca lotes disponíveis em ordem FIFO (PostgreSQL)
+
+        Filtro e ordenação empurrados pro banco: só as linhas
+        úteis atravessam a rede, já na ordem de consumo —
+        zero sort em Python!
+
+        Args:
+            medicamento_id: ID do medicamento
+
+        Returns:
+            Lotes disponíveis, do mais antigo pro mais novo
+        """
+        hoje = date.today()
+
+        lotes_model = self.session.execute(
+            select(LoteModel)
+            .where(
+                LoteModel.medicamento_id == medicamento_id,
+                LoteModel.data_validade >= hoje,
+                LoteModel.quantidade > 0
+            )
+            .order_by(LoteModel.data_fabricacao)
+        ).scalars()
+
+        return [
+            self._modelo_para_entidade(modelo)
+            for modelo in lotes_model
+        ]
+
     def listar_vencendo_em(self, dias: int) -> List[Lote]:
         """
         Lista lotes que vencem nos próximos X dias (PostgreSQL)
@@ -154,18 +297,86 @@ class LoteRepositoryPostgres(LoteRepositoryPort):
         Returns:
             Lista de lotes vencendo
         """
-        data_limite = date.today() + timedelta(days=dias)
-        
-        lotes_model = self.session.query(LoteModel).filter(
-            LoteModel.data_validade <= data_limite,
-            LoteModel.data_validade >= date.today()
-        ).all()
-        
+        hoje = date.today()
+        data_limite = hoje + timedelta(days=dias)
+
+        # A janela [hoje, data_limite] vira um range scan no índice
+        # de data_validade (ver models.py) — o banco não varre a tabela
+        lotes_model = self.session.execute(
+            select(LoteModel)
+            .where(
+                LoteModel.data_validade >= hoje,
+                LoteModel.data_validade <= data_limite
+            )
+            .order_by(LoteModel.data_validade)
+        ).scalars()
+
         return [
             self._modelo_para_entidade(modelo)
             for modelo in lotes_model
         ]
-    
+
+    def listar_por_fabricacao_desde(self, data_inicial: date) -> List[Lote]:
+        """
+        Lista lotes fabricados desde uma data (PostgreSQL)
+
+        O predicado vai no WHERE: o banco devolve só o período
+        pedido (range scan no índice de data_fabricacao), em vez
+        de trafegar a tabela inteira pra filtrar em Python!
+
+        Args:
+            data_inicial: Data mínima de fabricação (inclusive)
+
+        Returns:
+            Lotes fabricados em data_inicial ou depois
+        """
+        lotes_model = self.session.execute(
+            select(LoteModel)
+            .where(LoteModel.data_fabricacao >= data_inicial)
+        ).scalars()
+
+        return [
+            self._modelo_para_entidade(modelo)
+            for modelo in lotes_model
+        ]
+
+    def agregar_estoque_disponivel(self, data_ref):
+        """
+        Agrega o estoque disponível por medicamento (PostgreSQL)
+
+        Um único GROUP BY devolve o catálogo inteiro agregado:
+        o banco soma, o Python só monta o dicionário. Acaba o
+        N+1 de buscar lotes medicamento por medicamento!
+
+        Args:
+            data_ref: Data de referência pra considerar vencimento
+
+        Returns:
+            Dicionário medicamento_id → (estoque_disponivel, total_lotes)
+        """
+        linhas = self.session.execute(
+            select(
+                LoteModel.medicamento_id,
+                func.coalesce(
+                    func.sum(
+                        case(
+                            (LoteModel.data_validade > data_ref,
+                             LoteModel.quantidade),
+                            else_=0
+                        )
+                    ),
+                    0
+                ),
+                func.count(LoteModel.id)
+            )
+            .group_by(LoteModel.medicamento_id)
+        )
+
+        return {
+            medicamento_id: (int(disponivel), total_lotes)
+            for medicamento_id, disponivel, total_lotes in linhas
+        }
+
     def atualizar(self, lote: Lote) -> Lote:
         """
         Atualiza lote no PostgreSQL
@@ -182,28 +393,70 @@ class LoteRepositoryPostgres(LoteRepositoryPort):
         if lote.id is None:
             raise ValueError("Lote precisa ter ID para atualizar!")
         
-        # Busca no banco
-        lote_model = self.session.query(LoteModel).filter(
-            LoteModel.id == lote.id
-        ).first()
-        
-        if lote_model is None:
+        # UPDATE direto (Core): 1 statement, sem SELECT prévio
+        # nem refresh depois — a entidade já tem os dados finais
+        resultado = self.session.execute(
+            update(LoteModel)
+            .where(LoteModel.id == lote.id)
+            .values(**self._entidade_para_valores(lote))
+        )
+
+        if resultado.rowcount == 0:
             raise ValueError(f"Lote {lote.id} não encontrado!")
-        
-        # Atualiza campos
-        lote_model.numero_lote = lote.numero_lote
-        lote_model.medicamento_id = lote.medicamento_id
-        lote_model.quantidade = lote.quantidade
-        lote_model.data_fabricacao = lote.data_fabricacao
-        lote_model.data_validade = lote.data_validade
-        lote_model.fornecedor = lote.fornecedor
-        
-        # Salva mudanças
-        self.session.commit()
-        self.session.refresh(lote_model)
-        
-        return self._modelo_para_entidade(lote_model)
+
+        return lote
     
+    def atualizar_muitos(self, lotes: List[Lote]) -> List[Lote]:
+        """
+        Atualiza vários lotes num ÚNICO statement
+
+        Passar uma lista de dicts (com o id!) pro UPDATE faz o
+        SQLAlchemy executar em modo "bulk por chave primária":
+        1 statement preparado, N conjuntos de parâmetros — a saída
+        FIFO que consome K lotes deixa de pagar K round-trips.
+
+        Args:
+            lotes: Lotes com dados atualizados
+
+        Returns:
+            Lista de lotes atualizados
+
+        Raises:
+            ValueError: Se algum lote não tiver ID ou não existir
+        """
+        if not lotes:
+            return []
+
+        for lote in lotes:
+            if lote.id is None:
+                raise ValueError("Lote precisa ter ID para atualizar!")
+
+        # Conferir os IDs ANTES do UPDATE: em executemany o driver não
+        # reporta rowcount confiável, então um ID fantasma passaria em
+        # silêncio — e a saída FIFO acharia que baixou estoque que não
+        # baixou! 1 SELECT só pros IDs (2 round-trips no total)
+        ids = [lote.id for lote in lotes]
+        existentes = set(
+            self.session.execute(
+                select(LoteModel.id).where(LoteModel.id.in_(ids))
+            ).scalars()
+        )
+        faltando = [id for id in ids if id not in existentes]
+        if faltando:
+            raise ValueError(
+                f"Lotes não encontrados: {faltando}"
+            )
+
+        self.session.execute(
+            update(LoteModel),
+            [
+                {"id": lote.id, **self._entidade_para_valores(lote)}
+                for lote in lotes
+            ]
+        )
+
+        return lotes
+
     def deletar(self, id: int) -> bool:
         """
         Deleta lote do PostgreSQL
@@ -214,14 +467,35 @@ class LoteRepositoryPostgres(LoteRepositoryPort):
         Returns:
             True se deletou, False se não encontrou
         """
-        lote_model = self.session.query(LoteModel).filter(
-            LoteModel.id == id
-        ).first()
-        
+        lote_model = self.session.get(LoteModel, id)
+
         if lote_model is None:
             return False
         
+        # Manda o DELETE agora; o commit fica pro fim do request
         self.session.delete(lote_model)
-        self.session.commit()
-        
-        return True
\ No newline at end of file
+        self.session.flush()
+
+        return True
+
+    def deletar_em_lote(self, ids: List[int]) -> int:
+        """
+        Deleta vários lotes num ÚNICO DELETE
+
+        DELETE ... WHERE id IN (...) — 1 round-trip pra N lotes,
+        em vez de um SELECT + DELETE por id.
+
+        Args:
+            ids: IDs dos lotes a deletar
+
+        Returns:
+            Quantidade de lotes efetivamente deletados
+        """
+        if not ids:
+            return 0
+
+        resultado = self.session.execute(
+            delete(LoteModel).where(LoteModel.id.in_(ids))
+        )
+
+        return resultado.rowcount
\ No newline at end of file
@@ -6,7 +6,9 @@ ATENÇÃO: Quando o programa encerra, os dados são perdidos!
 Isso é apenas para testes. Nas próximas aulas faremos com banco real.
 """
 
-from typing import Optional
+from threading import Lock
+from types import MappingProxyType
+from typing import Iterator, Optional
 from src.domain.entities import Medicamento
 from src.domain.ports import MedicamentoRepositoryPort
 
@@ -14,50 +16,89 @@ from src.domain.ports import MedicamentoRepositoryPort
 class MedicamentoRepositoryMemory(MedicamentoRepositoryPort):
     """
     Implementação em memória do repositório de medicamentos
-    
+
     Armazena medicamentos em um dicionário Python (RAM)
     Quando o programa fecha, perde tudo!
+
+    Concorrência por copy-on-write: escritas montam um dicionário NOVO
+    e trocam a referência (troca atômica sob o GIL). Leitores pegam o
+    snapshot vigente e leem sem lock nenhum — perfeito pra carga
+    dominada por leitura. Só as escritas se serializam entre si.
     """
-    
+
+    # __slots__: sem __dict__ por instância — acesso a atributo
+    # mais rápido e menos memória no caminho quente de leitura
+    __slots__ = ("_medicamentos", "_proximo_id", "_escrita")
+
     def __init__(self):
         """Inicializa o repositório vazio"""
-        self._medicamentos: dict[int, Medicamento] = {}
+        # MappingProxyType: snapshot imutável — ninguém muta por engano
+        self._medicamentos: "MappingProxyType[int, Medicamento]" = (
+            MappingProxyType({})
+        )
         self._proximo_id = 1
-    
+        self._escrita = Lock()  # Serializa escritores; leitores nunca esperam
+
     def salvar(self, medicamento: Medicamento) -> Medicamento:
         """Salva medicamento na memória"""
-        # Gera ID se não tiver
-        if medicamento.id is None:
-            medicamento.id = self._proximo_id
-            self._proximo_id += 1
-        
-        # Salva no dicionário
-        self._medicamentos[medicamento.id] = medicamento
-        
+        with self._escrita:
+            # Gera ID se não tiver
+            if medicamento.id is None:
+                medicamento.id = self._proximo_id
+                self._proximo_id += 1
+
+            # Copy-on-write: copia, altera a cópia, troca o snapshot
+            novo = dict(self._medicamentos)
+            novo[medicamento.id] = medicamento
+            self._medicamentos = MappingProxyType(novo)
+
         return medicamento
-    
+
     def buscar_por_id(self, id: int) -> Optional[Medicamento]:
         """Busca medicamento por ID"""
         return self._medicamentos.get(id)
-    
+
     def listar_todos(self) -> list[Medicamento]:
         """Lista todos os medicamentos"""
         return list(self._medicamentos.values())
-    
+
+    def iterar_todos(self) -> Iterator[Medicamento]:
+        """
+        Itera sobre todos os medicamentos SEM copiar
+
+        Devolve um iterador direto sobre a view do snapshot vigente:
+        zero alocação de lista, não importa o tamanho do catálogo.
+        Como o snapshot nunca muda (copy-on-write), a iteração é
+        segura mesmo com escritas concorrentes!
+        """
+        return iter(self._medicamentos.values())
+
     def atualizar(self, medicamento: Medicamento) -> Medicamento:
         """Atualiza medicamento existente"""
         if medicamento.id is None:
             raise ValueError("Medicamento precisa ter ID para atualizar!")
-        
-        if medicamento.id not in self._medicamentos:
-            raise ValueError(f"Medicamento {medicamento.id} não encontrado!")
-        
-        self._medicamentos[medicamento.id] = medicamento
+
+        with self._escrita:
+            # EAFP: tenta direto — o caso comum é o medicamento existir
+            try:
+                self._medicamentos[medicamento.id]
+            except KeyError:
+                raise ValueError(f"Medicamento {medicamento.id} não encontrado!")
+
+            novo = dict(self._medicamentos)
+            novo[medicamento.id] = medicamento
+            self._medicamentos = MappingProxyType(novo)
+
         return medicamento
-    
+
     def deletar(self, id: int) -> bool:
         """Deleta medicamento por ID"""
-        if id in self._medicamentos:
-            del self._medicamentos[id]
-            return True
-        return False
\ No newline at end of file
+        with self._escrita:
+            novo = dict(self._medicamentos)
+            # EAFP: tenta remover da cópia numa operação só
+            try:
+                del novo[id]
+            except KeyError:
+                return False
+            self._medicamentos = MappingProxyType(novo)
+        return True
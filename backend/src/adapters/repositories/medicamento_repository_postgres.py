@@ -3,8 +3,9 @@ Adapter: Repositório de Medicamentos no PostgreSQL
 Implementa MedicamentoRepositoryPort salvando no banco real
 """
 
-from typing import Optional, List
+from typing import Iterator, Optional, List
 from decimal import Decimal
+from sqlalchemy import delete, insert, select, update
 from sqlalchemy.orm import Session
 
 from src.domain.entities import Medicamento
@@ -32,7 +33,8 @@ class MedicamentoRepositoryPostgres(MedicamentoRepositoryPort):
         """
         self.session = session
 
-    def _entidade_para_modelo(self, medicamento: Medicamento) -> MedicamentoModel:
+    @staticmethod
+    def _entidade_para_modelo(medicamento: Medicamento) -> MedicamentoModel:
         """
         Converte Entidade → Modelo
     
@@ -48,12 +50,35 @@ class MedicamentoRepositoryPostgres(MedicamentoRepositoryPort):
             id=medicamento.id,
             nome=medicamento.nome,
             principio_ativo=medicamento.principio_ativo,
-            preco=str(medicamento.preco),
+            preco=medicamento.preco,  # Coluna NUMERIC aceita Decimal direto!
             estoque_minimo=medicamento.estoque_minimo,
             requer_receita=1 if medicamento.requer_receita else 0  # ← NOVO! (Aula 10) - Converte   bool → int
         )
     
-    def _modelo_para_entidade(self, modelo: MedicamentoModel) -> Medicamento:
+    @staticmethod
+    def _entidade_para_valores(medicamento: Medicamento) -> dict:
+        """
+        Converte Entidade → dict de valores (pra INSERT em lote)
+
+        Mesmo mapeamento de campos do _entidade_para_modelo,
+        mas emite dict puro (sem passar pela unit-of-work do ORM)
+
+        Args:
+            medicamento: Entidade de domínio
+
+        Returns:
+            Dicionário coluna → valor
+        """
+        return {
+            "nome": medicamento.nome,
+            "principio_ativo": medicamento.principio_ativo,
+            "preco": medicamento.preco,
+            "estoque_minimo": medicamento.estoque_minimo,
+            "requer_receita": 1 if medicamento.requer_receita else 0
+        }
+
+    @staticmethod
+    def _modelo_para_entidade(modelo: MedicamentoModel) -> Medicamento:
         """
         Converte Modelo → Entidade
     
@@ -65,12 +90,12 @@ class MedicamentoRepositoryPostgres(MedicamentoRepositoryPort):
         Returns:
             Entidade de domínio limpa (sem dependências do banco)
         """
-        from decimal import Decimal
-    
         return Medicamento(
             id=modelo.id,
             nome=modelo.nome,
             principio_ativo=modelo.principio_ativo,
+            # Coluna NUMERIC já devolve Decimal; o isinstance só cobre
+            # bases antigas que ainda tenham preço como texto
             preco=Decimal(modelo.preco) if isinstance(modelo.preco, str) else modelo.preco,
             estoque_minimo=modelo.estoque_minimo,
             requer_receita=bool(modelo.requer_receita)  #  - Converte int → bool
@@ -94,14 +119,45 @@ class MedicamentoRepositoryPostgres(MedicamentoRepositoryPort):
         # Converter Entidade → Modelo
         modelo = self._entidade_para_modelo(medicamento)
         
-        # Salvar no banco
+        # Salvar no banco — flush() manda o INSERT e pega o ID gerado,
+        # mas o commit (fsync!) fica pro fim do request (ver get_session)
         self.session.add(modelo)
-        self.session.commit()
-        self.session.refresh(modelo)
+        self.session.flush()
         
         # Converter Modelo → Entidade
         return self._modelo_para_entidade(modelo)
-    
+
+    def salvar_em_lote(self, medicamentos: List[Medicamento]) -> List[Medicamento]:
+        """
+        Salva vários medicamentos num ÚNICO INSERT
+
+        Amortiza a latência de rede: 1 round-trip pra N linhas,
+        em vez de N commits (um por medicamento).
+
+        Args:
+            medicamentos: Lista de medicamentos a salvar
+
+        Returns:
+            Lista de medicamentos salvos (com IDs gerados pelo banco)
+        """
+        if not medicamentos:
+            return []
+
+        # Um único INSERT com todas as linhas
+        resultado = self.session.execute(
+            insert(MedicamentoModel)
+            .values([self._entidade_para_valores(med) for med in medicamentos])
+            .returning(MedicamentoModel.id)
+        )
+        ids_gerados = resultado.scalars().all()
+
+        # Preenche os IDs gerados (mesma ordem do INSERT)
+        # O commit fica pro fim do request (ver get_session)
+        for medicamento, novo_id in zip(medicamentos, ids_gerados):
+            medicamento.id = novo_id
+
+        return medicamentos
+
     def buscar_por_id(self, id: int) -> Optional[Medicamento]:
         """
         Busca medicamento por ID no PostgreSQL
@@ -112,15 +168,49 @@ class MedicamentoRepositoryPostgres(MedicamentoRepositoryPort):
         Returns:
             Medicamento encontrado ou None se não existir
         """
-        modelo = self.session.query(MedicamentoModel).filter(
-            MedicamentoModel.id == id
-        ).first()
-        
+        # session.get busca direto pela chave primária e ainda
+        # aproveita o identity map (objeto já carregado = zero SQL!)
+        modelo = self.session.get(MedicamentoModel, id)
+
         if modelo is None:
             return None
-        
+
         return self._modelo_para_entidade(modelo)
     
+    def buscar_por_ids(self, ids) -> List[Medicamento]:
+        """
+        Busca vários medicamentos num ÚNICO SELECT
+
+        WHERE id IN (...): 1 round-trip pra N IDs, em vez de N
+        session.get — mata o N+1 dos relatórios que precisam dos
+        medicamentos de uma lista de lotes!
+
+        Args:
+            ids: IDs dos medicamentos a buscar
+
+        Returns:
+            Lista dos medicamentos encontrados
+        """
+        ids = list(ids)
+        if not ids:
+            return []
+
+        linhas = self.session.execute(
+            select(
+                MedicamentoModel.id,
+                MedicamentoModel.nome,
+                MedicamentoModel.principio_ativo,
+                MedicamentoModel.preco,
+                MedicamentoModel.estoque_minimo,
+                MedicamentoModel.requer_receita
+            ).where(MedicamentoModel.id.in_(ids))
+        )
+
+        return [
+            self._modelo_para_entidade(linha)
+            for linha in linhas
+        ]
+
     def listar_todos(self) -> List[Medicamento]:
         """
         Lista todos os medicamentos cadastrados no PostgreSQL
@@ -128,13 +218,47 @@ class MedicamentoRepositoryPostgres(MedicamentoRepositoryPort):
         Returns:
             Lista de medicamentos (pode ser vazia)
         """
-        modelos = self.session.query(MedicamentoModel).all()
-        
+        # Select de colunas (Core): cada linha vem como named tuple,
+        # sem custo de montar instância ORM nem de identity map.
+        # A linha tem os mesmos atributos do modelo, então a conversão
+        # pra entidade é a mesma!
+        linhas = self.session.execute(
+            select(
+                MedicamentoModel.id,
+                MedicamentoModel.nome,
+                MedicamentoModel.principio_ativo,
+                MedicamentoModel.preco,
+                MedicamentoModel.estoque_minimo,
+                MedicamentoModel.requer_receita
+            )
+        )
+
         return [
-            self._modelo_para_entidade(modelo)
-            for modelo in modelos
+            self._modelo_para_entidade(linha)
+            for linha in linhas
         ]
-    
+
+    def iterar_todos(self) -> Iterator[Medicamento]:
+        """
+        Itera sobre todos os medicamentos via cursor streaming
+
+        yield_per vai na OPÇÃO DE EXECUÇÃO do select (não no
+        Result já executado!): é isso que liga stream_results e o
+        cursor do lado do servidor — as linhas chegam em páginas
+        de 1000 e a memória fica constante, em vez de materializar
+        a tabela inteira como listar_todos() faz. Ideal pra
+        exportações e varreduras em tabelas grandes!
+
+        Returns:
+            Iterador de medicamentos
+        """
+        resultado = self.session.execute(
+            select(MedicamentoModel).execution_options(yield_per=1000)
+        ).scalars()
+
+        for modelo in resultado:
+            yield self._modelo_para_entidade(modelo)
+
     def atualizar(self, medicamento: Medicamento) -> Medicamento:
         """
         Atualiza medicamento existente
@@ -151,25 +275,23 @@ class MedicamentoRepositoryPostgres(MedicamentoRepositoryPort):
         if medicamento.id is None:
             raise ValueError("Medicamento precisa ter ID para atualizar!")
         
-        # Buscar no banco
-        modelo = self.session.query(MedicamentoModel).filter(
-            MedicamentoModel.id == medicamento.id
-        ).first()
-        
-        if modelo is None:
+        # UPDATE direto (Core): 1 statement, sem SELECT prévio
+        # nem refresh depois — a entidade já tem os dados finais
+        resultado = self.session.execute(
+            update(MedicamentoModel)
+            .where(MedicamentoModel.id == medicamento.id)
+            .values(
+                nome=medicamento.nome,
+                principio_ativo=medicamento.principio_ativo,
+                preco=medicamento.preco,
+                estoque_minimo=medicamento.estoque_minimo
+            )
+        )
+
+        if resultado.rowcount == 0:
             raise ValueError(f"Medicamento {medicamento.id} não encontrado!")
-        
-        # Atualizar campos
-        modelo.nome = medicamento.nome
-        modelo.principio_ativo = medicamento.principio_ativo
-        modelo.preco = str(medicamento.preco)
-        modelo.estoque_minimo = medicamento.estoque_minimo
-        
-        # Salvar
-        self.session.commit()
-        self.session.refresh(modelo)
-        
-        return self._modelo_para_entidade(modelo)
+
+        return medicamento
     
     def deletar(self, id: int) -> bool:
         """
@@ -181,14 +303,35 @@ class MedicamentoRepositoryPostgres(MedicamentoRepositoryPort):
         Returns:
             True se deletado com sucesso, False se não existe
         """
-        modelo = self.session.query(MedicamentoModel).filter(
-            MedicamentoModel.id == id
-        ).first()
-        
+        modelo = self.session.get(MedicamentoModel, id)
+
         if modelo is None:
             return False
         
+        # Manda o DELETE agora; o commit fica pro fim do request
         self.session.delete(modelo)
-        self.session.commit()
-        
-        return True
\ No newline at end of file
+        self.session.flush()
+
+        return True
+
+    def deletar_em_lote(self, ids: List[int]) -> int:
+        """
+        Deleta vários medicamentos num ÚNICO DELETE
+
+        DELETE ... WHERE id IN (...) — 1 round-trip pra N medicamentos,
+        em vez de um SELECT + DELETE por id.
+
+        Args:
+            ids: IDs dos medicamentos a deletar
+
+        Returns:
+            Quantidade de medicamentos efetivamente deletados
+        """
+        if not ids:
+            return 0
+
+        resultado = self.session.execute(
+            delete(MedicamentoModel).where(MedicamentoModel.id.in_(ids))
+        )
+
+        return resultado.rowcount
\ No newline at end of file
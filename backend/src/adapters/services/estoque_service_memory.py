@@ -5,10 +5,29 @@ Implementa o EstoqueServicePort usando estruturas em memória
 ATENÇÃO: Dados são perdidos ao encerrar o programa!
 """
 
-from typing import Dict, List
+from collections import defaultdict, deque
+from datetime import date
+from threading import Lock
+from typing import Deque, Dict, List, NamedTuple, Optional
+
+from src.domain.entities import Lote
 from src.domain.ports import EstoqueServicePort, MedicamentoRepositoryPort, LoteRepositoryPort
 
 
+class Movimentacao(NamedTuple):
+    """
+    Registro de uma movimentação de estoque
+
+    NamedTuple em vez de dict: ~4x menos memória por registro
+    (o histórico cresce sem parar num processo longo!), imutável,
+    e com acesso por atributo (mov.tipo) em vez de chave.
+    """
+    tipo: str  # "ENTRADA" ou "SAIDA"
+    medicamento_id: int
+    lote_id: int
+    quantidade: int
+
+
 class EstoqueServiceMemory(EstoqueServicePort):
     """
     Implementação em memória do serviço de estoque
@@ -19,21 +38,66 @@ class EstoqueServiceMemory(EstoqueServicePort):
     def __init__(
         self,
         medicamento_repository: MedicamentoRepositoryPort,
-        lote_repository: LoteRepositoryPort
+        lote_repository: LoteRepositoryPort,
+        historico_max: int = 100_000
     ):
         """
         Inicializa o serviço com seus repositórios
-        
+
         Args:
             medicamento_repository: Repositório de medicamentos
             lote_repository: Repositório de lotes
+            historico_max: Tamanho máximo do histórico de movimentações
         """
         self.medicamento_repo = medicamento_repository
         self.lote_repo = lote_repository
-        
-        # Controle interno de movimentações (em memória)
-        self._movimentacoes: List[Dict] = []
+
+        # Histórico de movimentações LIMITADO: deque com maxlen
+        # descarta a movimentação mais antiga quando enche — a
+        # memória para de crescer num processo que fica dias no ar.
+        # (Uma lista comum cresceria pra sempre!)
+        self._movimentacoes: Deque[Movimentacao] = deque(maxlen=historico_max)
+
+        # Trava do histórico: cada operação monta seu batch local
+        # e entra na trava UMA vez pra anexar tudo — requisições
+        # concorrentes disputam 1 aquisição por operação, não 1
+        # por lote consumido
+        self._escrita = Lock()
+
+        # Cache incremental de totais por medicamento: leituras
+        # repetidas viram O(1) — quem paga a agregação é a mutação
+        # (que já está com o lote na mão!). Vale enquanto as
+        # mudanças de estoque passarem pelo serviço; quem mexer
+        # direto no repositório deve chamar invalidar_cache().
+        self._estoque_cache: Dict[int, Dict[str, int]] = {}
+        self._dia_cache = date.today()
     
+    def _cache(self) -> Dict[int, Dict[str, int]]:
+        """
+        Devolve o cache de totais, zerando-o na virada do dia
+
+        Quando a data muda, lotes podem ter vencido — os totais
+        de disponível/vencido cacheados ficariam errados. Descartar
+        tudo no tick do dia mantém o cache sempre correto.
+        """
+        hoje = date.today()
+        if hoje != self._dia_cache:
+            self._estoque_cache.clear()
+            self._dia_cache = hoje
+        return self._estoque_cache
+
+    def invalidar_cache(self, medicamento_id: Optional[int] = None) -> None:
+        """
+        Invalida o cache de totais
+
+        Args:
+            medicamento_id: Medicamento a invalidar (None = todos)
+        """
+        if medicamento_id is None:
+            self._estoque_cache.clear()
+        else:
+            self._estoque_cache.pop(medicamento_id, None)
+
     def verificar_disponibilidade(self, medicamento_id: int, quantidade: int) -> bool:
         """
         Verifica se tem quantidade disponível de um medicamento
@@ -45,17 +109,30 @@ class EstoqueServiceMemory(EstoqueServicePort):
         Returns:
             True se tem disponível, False caso contrário
         """
+        # Com totais em cache a resposta é O(1), sem tocar nos lotes
+        totais = self._cache().get(medicamento_id)
+        if totais is not None:
+            return totais["estoque_disponivel"] >= quantidade
+
         # Busca todos os lotes deste medicamento
         lotes = self.lote_repo.buscar_por_medicamento(medicamento_id)
-        
-        # Soma quantidade disponível (lotes não vencidos)
-        quantidade_disponivel = sum(
-            lote.quantidade
-            for lote in lotes
-            if not lote.esta_vencido()
-        )
-        
-        return quantidade_disponivel >= quantidade
+
+        # Acumula e CORTA assim que cobrir o pedido: o caso comum
+        # (pedido pequeno, estoque grande) resolve nos primeiros
+        # lotes sem varrer — nem vencer — o resto da lista.
+        # Checar ANTES do loop preserva a semântica do >= original:
+        # pedido de 0 é atendível mesmo sem nenhum lote disponível
+        quantidade_disponivel = 0
+        if quantidade_disponivel >= quantidade:
+            return True
+        for lote in lotes:
+            if lote.esta_vencido():
+                continue
+            quantidade_disponivel += lote.quantidade
+            if quantidade_disponivel >= quantidade:
+                return True
+
+        return False
     
     def registrar_entrada(self, medicamento_id: int, lote_id: int, quantidade: int) -> None:
         """
@@ -85,13 +162,21 @@ class EstoqueServiceMemory(EstoqueServicePort):
         lote.adicionar_quantidade(quantidade)
         self.lote_repo.atualizar(lote)
         
-        # Registra movimentação
-        self._movimentacoes.append({
-            'tipo': 'ENTRADA',
-            'medicamento_id': medicamento_id,
-            'lote_id': lote_id,
-            'quantidade': quantidade
-        })
+        # Registra movimentação (sob a trava do histórico)
+        with self._escrita:
+            self._movimentacoes.append(
+                Movimentacao('ENTRADA', medicamento_id, lote_id, quantidade)
+            )
+
+        # Atualiza o cache incrementalmente (se já foi computado):
+        # a mutação já sabe o lote e a quantidade, a soma é de graça
+        totais = self._cache().get(medicamento_id)
+        if totais is not None:
+            totais["estoque_total"] += quantidade
+            if lote.esta_vencido():
+                totais["estoque_vencido"] += quantidade
+            else:
+                totais["estoque_disponivel"] += quantidade
     
     def registrar_saida(self, medicamento_id: int, quantidade: int) -> None:
         """
@@ -109,91 +194,145 @@ class EstoqueServiceMemory(EstoqueServicePort):
         if quantidade <= 0:
             raise ValueError("Quantidade deve ser maior que zero!")
         
-        # Verifica disponibilidade
-        if not self.verificar_disponibilidade(medicamento_id, quantidade):
-            raise ValueError(f"Estoque insuficiente de medicamento {medicamento_id}!")
-        
-        # Busca lotes disponíveis (ordena por data de fabricação - FIFO)
-        lotes = self.lote_repo.buscar_por_medicamento(medicamento_id)
-        lotes_disponiveis = [
-            lote for lote in lotes
-            if not lote.esta_vencido() and lote.quantidade > 0
-        ]
-        lotes_disponiveis.sort(key=lambda l: l.data_fabricacao)
-        
-        # Retira quantidade dos lotes (FIFO)
+        # Monta o PLANO de retirada numa passada só: acumula em
+        # ordem FIFO e para assim que cobrir o pedido. Antes a
+        # disponibilidade era somada numa passada separada e a
+        # retirada refazia as contas — agora é 1 passada, e o
+        # caso comum nem olha os lotes além dos primeiros.
+        # O repositório já entrega filtrado E em ordem FIFO —
+        # adapters de banco resolvem isso com WHERE + ORDER BY,
+        # sem trazer lote vencido pela rede nem ordenar em Python
+        plano = []
         quantidade_restante = quantidade
-        
-        for lote in lotes_disponiveis:
+
+        for lote in self.lote_repo.buscar_disponiveis_fifo(medicamento_id):
+            quantidade_retirar = min(quantidade_restante, lote.quantidade)
+            plano.append((lote, quantidade_retirar))
+            quantidade_restante -= quantidade_retirar
             if quantidade_restante == 0:
                 break
-            
-            # Quanto retirar deste lote?
-            quantidade_retirar = min(quantidade_restante, lote.quantidade)
-            
-            # Retira do lote
+
+        # Plano não fechou? Nenhum lote foi tocado ainda —
+        # aborta SEM saída parcial!
+        if quantidade_restante > 0:
+            raise ValueError(f"Estoque insuficiente de medicamento {medicamento_id}!")
+
+        # Executa o plano: retira dos lotes (só em memória) e
+        # acumula as movimentações num lote local
+        movimentacoes_saida = []
+
+        for lote, quantidade_retirar in plano:
             lote.retirar_quantidade(quantidade_retirar)
-            self.lote_repo.atualizar(lote)
-            
-            # Registra movimentação
-            self._movimentacoes.append({
-                'tipo': 'SAIDA',
-                'medicamento_id': medicamento_id,
-                'lote_id': lote.id,
-                'quantidade': quantidade_retirar
-            })
-            
-            quantidade_restante -= quantidade_retirar
+            movimentacoes_saida.append(
+                Movimentacao('SAIDA', medicamento_id, lote.id, quantidade_retirar)
+            )
+
+        # Persiste TODOS os lotes do plano numa chamada só:
+        # no Postgres vira 1 UPDATE em lote em vez de K round-trips
+        self.lote_repo.atualizar_muitos([lote for lote, _ in plano])
+
+        # 1 entrada na trava + 1 extend, por mais lotes que o
+        # plano tenha consumido
+        with self._escrita:
+            self._movimentacoes.extend(movimentacoes_saida)
+
+        # Atualiza o cache incrementalmente (saída só consome
+        # lotes disponíveis, então vencido não muda)
+        totais = self._cache().get(medicamento_id)
+        if totais is not None:
+            totais["estoque_total"] -= quantidade
+            totais["estoque_disponivel"] -= quantidade
     
-    def consultar_estoque_atual(self, medicamento_id: int) -> Dict[str, int]:
+    def _agrupar_lotes_por_medicamento(self) -> Dict[int, List[Lote]]:
+        """
+        Agrupa TODOS os lotes por medicamento numa varredura só
+
+        Uma chamada ao repositório e um loop de bucketing, em vez
+        de 1 buscar_por_medicamento por medicamento (M consultas
+        viram 1!). Usado pelos relatórios que olham o estoque todo.
+
+        Returns:
+            Dicionário medicamento_id → lista de lotes
+        """
+        buckets: Dict[int, List[Lote]] = defaultdict(list)
+        for lote in self.lote_repo.iterar_todos():
+            buckets[lote.medicamento_id].append(lote)
+        return buckets
+
+    def consultar_estoque_atual(
+        self,
+        medicamento_id: int,
+        lotes: Optional[List[Lote]] = None
+    ) -> Dict[str, int]:
         """
         Retorna informações de estoque de um medicamento
-        
+
         Args:
             medicamento_id: ID do medicamento
-            
+            lotes: Lotes já buscados (opcional) — relatórios que
+                   varrem vários medicamentos passam o bucket pronto
+                   e evitam 1 consulta ao repositório por medicamento
+
         Returns:
             Dicionário com informações de estoque
         """
-        # Busca lotes
-        lotes = self.lote_repo.buscar_por_medicamento(medicamento_id)
-        
-        # Calcula totais
-        estoque_total = sum(lote.quantidade for lote in lotes)
-        
-        estoque_disponivel = sum(
-            lote.quantidade
-            for lote in lotes
-            if not lote.esta_vencido()
-        )
-        
-        estoque_vencido = sum(
-            lote.quantidade
-            for lote in lotes
-            if lote.esta_vencido()
-        )
-        
-        return {
+        # Busca lotes (se o chamador ainda não buscou)
+        if lotes is None:
+            # Cache quente? Resposta O(1), sem varrer lote nenhum
+            totais = self._cache().get(medicamento_id)
+            if totais is not None:
+                # Cópia: o chamador pode mutar o dict à vontade
+                return dict(totais)
+
+            lotes = self.lote_repo.buscar_por_medicamento(medicamento_id)
+
+        # Calcula os 3 totais numa passada só: esta_vencido() e
+        # quantidade são avaliados UMA vez por lote
+        estoque_total = 0
+        estoque_disponivel = 0
+        estoque_vencido = 0
+
+        for lote in lotes:
+            quantidade = lote.quantidade
+            estoque_total += quantidade
+            if lote.esta_vencido():
+                estoque_vencido += quantidade
+            else:
+                estoque_disponivel += quantidade
+
+        resultado = {
             "estoque_total": estoque_total,
             "estoque_disponivel": estoque_disponivel,
             "estoque_vencido": estoque_vencido,
             "quantidade_lotes": len(lotes)
         }
-    
+
+        # Alimenta o cache na primeira consulta (lazy rebuild)
+        self._cache()[medicamento_id] = dict(resultado)
+
+        return resultado
+
     def listar_estoque_baixo(self) -> List[Dict]:
         """
         Lista medicamentos com estoque abaixo do mínimo
-        
+
         Returns:
             Lista de dicionários com informações dos medicamentos
         """
         medicamentos = self.medicamento_repo.listar_todos()
         estoque_baixo = []
-        
+
+        # Uma varredura nos lotes pro relatório inteiro:
+        # O(M + N) em vez de O(M·N) consultas + passadas
+        lotes_por_medicamento = self._agrupar_lotes_por_medicamento()
+
         for medicamento in medicamentos:
-            # Consulta estoque
-            estoque = self.consultar_estoque_atual(medicamento.id)
-            
+            # Consulta estoque usando o bucket já agrupado
+            estoque = self.consultar_estoque_atual(
+                medicamento.id,
+                lotes_por_medicamento.get(medicamento.id, [])
+            )
+
             # Verifica se está abaixo do mínimo
             if estoque['estoque_disponivel'] < medicamento.estoque_minimo:
                 estoque_baixo.append({
@@ -203,5 +342,5 @@ class EstoqueServiceMemory(EstoqueServicePort):
                     'estoque_minimo': medicamento.estoque_minimo,
                     'diferenca': medicamento.estoque_minimo - estoque['estoque_disponivel']
                 })
-        
+
         return estoque_baixo
\ No newline at end of file
@@ -0,0 +1,99 @@
+"""
+Cache de Respostas em Memória (TTL)
+
+Relatórios re-agregam o estoque inteiro a cada chamada, mas o dado
+muda devagar — guardar a resposta pronta por alguns segundos corta
+a maior parte das idas ao banco.
+
+É um cache POR PROCESSO (dicionário + trava): zero dependência
+externa. Num cluster com vários workers cada processo tem o seu;
+se um dia precisar de cache compartilhado, o caminho é um Redis
+na frente com esta mesma interface.
+"""
+
+from threading import Lock
+from time import monotonic
+from typing import Any, Dict, Optional, Tuple
+
+
+class CacheTTL:
+    """
+    Cache chave → valor com expiração por tempo (TTL)
+
+    Uso:
+        resposta = cache.obter("relatorios:estoque:False")
+        if resposta is None:
+            resposta = ...  # calcula de verdade
+            cache.guardar("relatorios:estoque:False", resposta)
+    """
+
+    def __init__(self, ttl_segundos: float = 30.0):
+        """
+        Inicializa o cache vazio
+
+        Args:
+            ttl_segundos: Por quanto tempo cada entrada vale
+        """
+        self._ttl = ttl_segundos
+        # chave → (expira_em, valor)
+        self._itens: Dict[str, Tuple[float, Any]] = {}
+        self._escrita = Lock()
+
+        # Contadores pra observabilidade (ver /metrics)
+        self.acertos = 0
+        self.faltas = 0
+
+    def obter(self, chave: str) -> Optional[Any]:
+        """
+        Busca um valor ainda válido no cache
+
+        Args:
+            chave: Chave da entrada
+
+        Returns:
+            Valor guardado, ou None se não existe/expirou
+        """
+        item = self._itens.get(chave)
+        if item is None or item[0] < monotonic():
+            self.faltas += 1
+            return None
+
+        self.acertos += 1
+        return item[1]
+
+    def guardar(self, chave: str, valor: Any) -> None:
+        """
+        Guarda um valor com o TTL do cache
+
+        Args:
+            chave: Chave da entrada
+            valor: Valor a guardar
+        """
+        with self._escrita:
+            self._itens[chave] = (monotonic() + self._ttl, valor)
+
+    def invalidar(self, prefixo: Optional[str] = None) -> None:
+        """
+        Remove entradas do cache
+
+        Mutações (POST/DELETE) chamam isto pra resposta cacheada
+        não ficar mentindo depois que o dado mudou!
+
+        Args:
+            prefixo: Invalida só as chaves com este prefixo
+                     (None = limpa tudo)
+        """
+        with self._escrita:
+            if prefixo is None:
+                self._itens.clear()
+            else:
+                expiradas = [
+                    chave for chave in self._itens
+                    if chave.startswith(prefixo)
+                ]
+                for chave in expiradas:
+                    del self._itens[chave]
+
+
+# Instância única compartilhada pelos controllers
+cache_respostas = CacheTTL(ttl_segundos=30.0)
@@ -6,7 +6,6 @@ Endpoints REST para gerenciar lotes
 from typing import List
 
 from fastapi import APIRouter, HTTPException, Depends, status
-from sqlalchemy.orm import Session
 
 from ..schemas.lote_schema import (
     LoteCreate,
@@ -14,7 +13,8 @@ from ..schemas.lote_schema import (
     LoteUpdate
 )
 from ...adapters.repositories import LoteRepositoryPostgres
-from ...infrastructure.database import get_session
+from ..cache import cache_respostas
+from ..dependencies import get_lote_repo
 from ...domain.entities import Lote
 
 
@@ -34,7 +34,7 @@ router = APIRouter(
 )
 def criar_lote(
     lote_data: LoteCreate,
-    session: Session = Depends(get_session)
+    repository: LoteRepositoryPostgres = Depends(get_lote_repo)
 ):
     """
     Registra um novo lote de medicamentos no sistema
@@ -48,27 +48,18 @@ def criar_lote(
     - **data_validade**: Data de validade
     - **fornecedor**: Nome do fornecedor
     """
-    try:
-        repository = LoteRepositoryPostgres(session)
-        
-        # Converter Pydantic → Entidade
-        lote = Lote(**lote_data.dict())
-        
-        # Salvar
-        lote_salvo = repository.salvar(lote)
-        
-        return lote_salvo
-        
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Erro ao cadastrar lote: {str(e)}"
-        )
+    # Converter Pydantic → Entidade (model_dump: caminho rápido
+    # do Pydantic v2, sem o wrapper legado .dict()).
+    # ValueError de domínio → 400 no handler global (ver main.py)
+    lote = Lote(**lote_data.model_dump())
+
+    # Salvar
+    lote_salvo = repository.salvar(lote)
+
+    # Dado mudou → relatório cacheado não vale mais
+    cache_respostas.invalidar("relatorios:")
+
+    return lote_salvo
 
 
 @router.get(
@@ -77,23 +68,16 @@ def criar_lote(
     summary="Listar lotes",
     description="Retorna lista de todos os lotes cadastrados"
 )
-def listar_lotes(session: Session = Depends(get_session)):
+def listar_lotes(
+    repository: LoteRepositoryPostgres = Depends(get_lote_repo)
+):
     """
     Lista todos os lotes
     
     Retorna array vazio se não houver lotes cadastrados.
     """
-    try:
-        repository = LoteRepositoryPostgres(session)
-        lotes = repository.listar_todos()
-        
-        return lotes
-        
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Erro ao listar lotes: {str(e)}"
-        )
+    # Erro inesperado sobe pro handler global
+    return repository.listar_todos()
 
 
 @router.get(
@@ -104,7 +88,7 @@ def listar_lotes(session: Session = Depends(get_session)):
 )
 def buscar_lote(
     lote_id: int,
-    session: Session = Depends(get_session)
+    repository: LoteRepositoryPostgres = Depends(get_lote_repo)
 ):
     """
     Busca lote por ID
@@ -113,26 +97,16 @@ def buscar_lote(
     
     Retorna erro 404 se não encontrado.
     """
-    try:
-        repository = LoteRepositoryPostgres(session)
-        lote = repository.buscar_por_id(lote_id)
-        
-        if lote is None:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Lote {lote_id} não encontrado"
-            )
-        
-        return lote
-        
-    except HTTPException:
-        raise
-    except Exception as e:
+    lote = repository.buscar_por_id(lote_id)
+
+    if lote is None:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Erro ao buscar lote: {str(e)}"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Lote {lote_id} não encontrado"
         )
 
+    return lote
+
 
 @router.get(
     "/medicamento/{medicamento_id}",
@@ -142,7 +116,7 @@ def buscar_lote(
 )
 def listar_lotes_por_medicamento(
     medicamento_id: int,
-    session: Session = Depends(get_session)
+    repository: LoteRepositoryPostgres = Depends(get_lote_repo)
 ):
     """
     Lista todos os lotes de um medicamento específico
@@ -155,17 +129,8 @@ def listar_lotes_por_medicamento(
     - Ver todos os lotes (vencidos ou não)
     - Planejar reposição de estoque
     """
-    try:
-        repository = LoteRepositoryPostgres(session)
-        lotes = repository.buscar_por_medicamento(medicamento_id)
-        
-        return lotes
-        
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Erro ao listar lotes: {str(e)}"
-        )
+    # Erro inesperado sobe pro handler global
+    return repository.buscar_por_medicamento(medicamento_id)
 
 
 @router.delete(
@@ -176,7 +141,7 @@ def listar_lotes_por_medicamento(
 )
 def deletar_lote(
     lote_id: int,
-    session: Session = Depends(get_session)
+    repository: LoteRepositoryPostgres = Depends(get_lote_repo)
 ):
     """
     Deleta lote por ID
@@ -186,22 +151,15 @@ def deletar_lote(
     Retorna 204 (No Content) se deletado com sucesso.
     Retorna 404 se lote não existe.
     """
-    try:
-        repository = LoteRepositoryPostgres(session)
-        deletado = repository.deletar(lote_id)
-        
-        if not deletado:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Lote {lote_id} não encontrado"
-            )
-        
-        return None
-        
-    except HTTPException:
-        raise
-    except Exception as e:
+    deletado = repository.deletar(lote_id)
+
+    if not deletado:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Erro ao deletar lote: {str(e)}"
-        )
\ No newline at end of file
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Lote {lote_id} não encontrado"
+        )
+
+    # Dado mudou → relatório cacheado não vale mais
+    cache_respostas.invalidar("relatorios:")
+
+    return None
\ No newline at end of file
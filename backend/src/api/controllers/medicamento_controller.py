@@ -6,10 +6,11 @@ Endpoints REST para gerenciar medicamentos
 from typing import List
 
 from fastapi import APIRouter, HTTPException, Depends, status
-from sqlalchemy.orm import Session
+from pydantic import TypeAdapter
 
 from ..schemas.medicamento_schema import (
     MedicamentoCreate,
+    MedicamentoDict,
     MedicamentoResponse,
     MedicamentoUpdate
 )
@@ -36,7 +37,8 @@ from ...adapters.repositories import (
     MedicamentoRepositoryPostgres,
     LoteRepositoryPostgres
 )
-from ...infrastructure.database import get_session
+from ..cache import cache_respostas
+from ..dependencies import get_medicamento_repo, get_lote_repo
 from ...domain.exceptions import ValidationError
 
 
@@ -46,6 +48,31 @@ router = APIRouter(
     tags=["Medicamentos"]
 )
 
+# Validador de lista COMPILADO uma vez só (import do módulo):
+# validar a lista inteira numa chamada é bem mais rápido que
+# instanciar o schema item por item
+_ESTOQUE_BAIXO_ADAPTER = TypeAdapter(List[EstoqueBaixoItem])
+
+
+def _resposta_confiavel(medicamento) -> MedicamentoDict:
+    """
+    Monta a resposta SEM revalidar
+
+    Fronteira de confiança: a entidade Medicamento já foi validada
+    pelo domínio na escrita (__post_init__), então revalidar na
+    leitura seria pagar a cadeia de validação de novo a cada linha.
+    TypedDict é dict puro em runtime: nem instância de modelo existe
+    — o orjson serializa direto, sem model_dump no meio!
+    """
+    return MedicamentoDict(
+        id=medicamento.id,
+        nome=medicamento.nome,
+        principio_ativo=medicamento.principio_ativo,
+        preco=str(medicamento.preco),
+        estoque_minimo=medicamento.estoque_minimo,
+        requer_receita=medicamento.requer_receita
+    )
+
 
 # ==========================================
 # ENDPOINTS DE MEDICAMENTOS (CRUD)
@@ -60,7 +87,7 @@ router = APIRouter(
 )
 def criar_medicamento(
     medicamento_data: MedicamentoCreate,
-    session: Session = Depends(get_session)
+    repository: MedicamentoRepositoryPostgres = Depends(get_medicamento_repo)
 ):
     """
     Cadastra um novo medicamento no sistema
@@ -73,40 +100,34 @@ def criar_medicamento(
     - **preco**: Preço no formato decimal (ex: 10.50)
     - **estoque_minimo**: Quantidade mínima em estoque (> 0)
     """
-    try:
-        # 1. Criar repositório
-        repository = MedicamentoRepositoryPostgres(session)
-        
-        # 2. Criar use case
-        use_case = CadastrarMedicamentoUseCase(repository)
-        
-        # 3. Executar
-        medicamento = use_case.execute(medicamento_data.dict())
-        
-        # 4. Retornar
-        return medicamento
-        
-    except ValueError as e:
-        # Erro de validação de domínio
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
-    except Exception as e:
-        # Erro inesperado
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Erro ao cadastrar medicamento: {str(e)}"
-        )
+    # 1. Criar use case (repositório vem injetado pelo Depends)
+    use_case = CadastrarMedicamentoUseCase(repository)
+
+    # 2. Executar (model_dump é o caminho rápido do Pydantic v2 —
+    # .dict() é o atalho legado v1, que ainda paga um deprecation
+    # warning por chamada!). ValueError de regra de negócio vira
+    # 400 no handler global (ver main.py) — endpoint sem try/except!
+    medicamento = use_case.execute(medicamento_data.model_dump())
+
+    # 3. Dado mudou → caches de catálogo e relatório não valem mais
+    cache_respostas.invalidar("relatorios:")
+    cache_respostas.invalidar("medicamentos:")
+
+    # 4. Retornar
+    return medicamento
 
 
 @router.get(
     "/",
-    response_model=List[MedicamentoResponse],
+    # response_model=None: a lista já sai validada pelo TypeAdapter
+    # abaixo — deixar o FastAPI revalidar seria pagar duas vezes!
+    response_model=None,
     summary="Listar medicamentos",
     description="Retorna lista de todos os medicamentos cadastrados"
 )
-def listar_medicamentos(session: Session = Depends(get_session)):
+def listar_medicamentos(
+    repository: MedicamentoRepositoryPostgres = Depends(get_medicamento_repo)
+):
     """
     Lista todos os medicamentos cadastrados
     
@@ -114,23 +135,24 @@ def listar_medicamentos(session: Session = Depends(get_session)):
     - Array vazio [] se não houver medicamentos
     - Array com medicamentos se houver cadastros
     """
-    try:
-        # 1. Criar repositório
-        repository = MedicamentoRepositoryPostgres(session)
-        
-        # 2. Criar use case
-        use_case = ListarMedicamentosUseCase(repository)
-        
-        # 3. Executar e retornar
-        medicamentos = use_case.execute()
-        
-        return medicamentos
-        
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Erro ao listar medicamentos: {str(e)}"
-        )
+    # Catálogo quase estático: resposta cacheada até a próxima
+    # mutação (criar/deletar invalida o prefixo "medicamentos:")
+    resposta = cache_respostas.obter("medicamentos:lista")
+    if resposta is not None:
+        return resposta
+
+    # 1. Criar use case (repositório vem injetado pelo Depends)
+    use_case = ListarMedicamentosUseCase(repository)
+
+    # 2. Executar e montar as respostas SEM revalidar (dado do
+    # banco é confiável — ver _resposta_confiavel)
+    resposta = [
+        _resposta_confiavel(medicamento)
+        for medicamento in use_case.execute()
+    ]
+
+    cache_respostas.guardar("medicamentos:lista", resposta)
+    return resposta
 
 
 @router.get(
@@ -141,7 +163,7 @@ def listar_medicamentos(session: Session = Depends(get_session)):
 )
 def buscar_medicamento(
     medicamento_id: int,
-    session: Session = Depends(get_session)
+    repository: MedicamentoRepositoryPostgres = Depends(get_medicamento_repo)
 ):
     """
     Busca um medicamento específico pelo ID
@@ -153,25 +175,21 @@ def buscar_medicamento(
     - Medicamento encontrado (200)
     - Erro 404 se medicamento não existe
     """
-    try:
-        repository = MedicamentoRepositoryPostgres(session)
+    chave = f"medicamentos:{medicamento_id}"
+    medicamento = cache_respostas.obter(chave)
+
+    if medicamento is None:
         medicamento = repository.buscar_por_id(medicamento_id)
-        
+
         if medicamento is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Medicamento {medicamento_id} não encontrado"
             )
-        
-        return medicamento
-        
-    except HTTPException:
-        raise  # Re-raise HTTP exceptions
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Erro ao buscar medicamento: {str(e)}"
-        )
+
+        cache_respostas.guardar(chave, medicamento)
+
+    return medicamento
 
 
 @router.delete(
@@ -182,7 +200,7 @@ def buscar_medicamento(
 )
 def deletar_medicamento(
     medicamento_id: int,
-    session: Session = Depends(get_session)
+    repository: MedicamentoRepositoryPostgres = Depends(get_medicamento_repo)
 ):
     """
     Remove um medicamento do sistema
@@ -196,27 +214,21 @@ def deletar_medicamento(
     
     ATENÇÃO: Esta ação é irreversível!
     """
-    try:
-        repository = MedicamentoRepositoryPostgres(session)
-        deletado = repository.deletar(medicamento_id)
-        
-        if not deletado:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Medicamento {medicamento_id} não encontrado"
-            )
-        
-        # 204 não retorna conteúdo
-        return None
-        
-    except HTTPException:
-        raise
-    except Exception as e:
+    deletado = repository.deletar(medicamento_id)
+
+    if not deletado:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Erro ao deletar medicamento: {str(e)}"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Medicamento {medicamento_id} não encontrado"
         )
 
+    # Dado mudou → caches de catálogo e relatório não valem mais
+    cache_respostas.invalidar("relatorios:")
+    cache_respostas.invalidar("medicamentos:")
+
+    # 204 não retorna conteúdo
+    return None
+
 
 # ==========================================
 # ENDPOINTS DE GESTÃO DE ESTOQUE
@@ -232,7 +244,8 @@ def deletar_medicamento(
 def adicionar_estoque(
     medicamento_id: int,
     dados: AdicionarEstoqueRequest,
-    session: Session = Depends(get_session)
+    medicamento_repo: MedicamentoRepositoryPostgres = Depends(get_medicamento_repo),
+    lote_repo: LoteRepositoryPostgres = Depends(get_lote_repo)
 ):
     """
     Adiciona quantidade ao estoque de um medicamento
@@ -250,44 +263,32 @@ def adicionar_estoque(
     - **data_validade**: Data de validade (YYYY-MM-DD)
     - **fornecedor**: Nome do fornecedor
     """
-    try:
-        # 1. Criar repositórios
-        medicamento_repo = MedicamentoRepositoryPostgres(session)
-        lote_repo = LoteRepositoryPostgres(session)
-        
-        # 2. Criar use case
-        use_case = AdicionarEstoqueUseCase(medicamento_repo, lote_repo)
-        
-        # 3. Executar
-        resultado = use_case.execute(
-            medicamento_id=medicamento_id,
-            quantidade=dados.quantidade,
-            numero_lote=dados.numero_lote,
-            data_fabricacao=dados.data_fabricacao,
-            data_validade=dados.data_validade,
-            fornecedor=dados.fornecedor
-        )
-        
-        # 4. Retornar
-        return EstoqueResponse(
-            medicamento_id=resultado["medicamento_id"],
-            medicamento_nome=resultado["medicamento_nome"],
-            estoque_atual=resultado["estoque_atual"],
-            estoque_minimo=resultado["estoque_minimo"],
-            status=resultado["status"],
-            mensagem=resultado["mensagem"]
-        )
-        
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Erro ao adicionar estoque: {str(e)}"
-        )
+    # 1. Criar use case (repositórios vêm injetados pelo Depends)
+    use_case = AdicionarEstoqueUseCase(medicamento_repo, lote_repo)
+
+    # 2. Executar (ValueError de domínio → 400 no handler global)
+    resultado = use_case.execute(
+        medicamento_id=medicamento_id,
+        quantidade=dados.quantidade,
+        numero_lote=dados.numero_lote,
+        data_fabricacao=dados.data_fabricacao,
+        data_validade=dados.data_validade,
+        fornecedor=dados.fornecedor
+    )
+
+    # 3. Dado mudou → caches de catálogo e relatório não valem mais
+    cache_respostas.invalidar("relatorios:")
+    cache_respostas.invalidar("medicamentos:")
+
+    # 4. Retornar
+    return EstoqueResponse(
+        medicamento_id=resultado["medicamento_id"],
+        medicamento_nome=resultado["medicamento_nome"],
+        estoque_atual=resultado["estoque_atual"],
+        estoque_minimo=resultado["estoque_minimo"],
+        status=resultado["status"],
+        mensagem=resultado["mensagem"]
+    )
 
 
 @router.post(
@@ -300,7 +301,8 @@ def adicionar_estoque(
 def remover_estoque(
     medicamento_id: int,
     dados: RemoverEstoqueRequest,
-    session: Session = Depends(get_session)
+    medicamento_repo: MedicamentoRepositoryPostgres = Depends(get_medicamento_repo),
+    lote_repo: LoteRepositoryPostgres = Depends(get_lote_repo)
 ):
     """
     Remove quantidade do estoque de um medicamento
@@ -319,51 +321,44 @@ def remover_estoque(
     Regra importante:
     - Não pode remover mais do que tem em estoque!
     """
-    try:
-        # 1. Criar repositórios
-        medicamento_repo = MedicamentoRepositoryPostgres(session)
-        lote_repo = LoteRepositoryPostgres(session)
-        
-        # 2. Criar use case
-        use_case = RemoverEstoqueUseCase(medicamento_repo, lote_repo)
-        
-        # 3. Executar
-        resultado = use_case.execute(
-            medicamento_id=medicamento_id,
-            quantidade=dados.quantidade,
-            motivo=dados.motivo,
-            observacao=dados.observacao
-        )
-        
-        # 4. Retornar
-        return EstoqueResponse(
-            medicamento_id=resultado["medicamento_id"],
-            medicamento_nome=resultado["medicamento_nome"],
-            estoque_atual=resultado["estoque_atual"],
-            estoque_minimo=resultado["estoque_minimo"],
-            status=resultado["status"],
-            mensagem=resultado["mensagem"]
-        )
-        
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Erro ao remover estoque: {str(e)}"
-        )
+    # 1. Criar use case (repositórios vêm injetados pelo Depends)
+    use_case = RemoverEstoqueUseCase(medicamento_repo, lote_repo)
+
+    # 2. Executar (ValueError de domínio → 400 no handler global)
+    resultado = use_case.execute(
+        medicamento_id=medicamento_id,
+        quantidade=dados.quantidade,
+        motivo=dados.motivo,
+        observacao=dados.observacao
+    )
+
+    # 3. Dado mudou → caches de catálogo e relatório não valem mais
+    cache_respostas.invalidar("relatorios:")
+    cache_respostas.invalidar("medicamentos:")
+
+    # 4. Retornar
+    return EstoqueResponse(
+        medicamento_id=resultado["medicamento_id"],
+        medicamento_nome=resultado["medicamento_nome"],
+        estoque_atual=resultado["estoque_atual"],
+        estoque_minimo=resultado["estoque_minimo"],
+        status=resultado["status"],
+        mensagem=resultado["mensagem"]
+    )
 
 
 @router.get(
     "/estoque-baixo",
-    response_model=List[EstoqueBaixoItem],
+    # response_model=None: a lista já sai validada pelo TypeAdapter
+    # abaixo — deixar o FastAPI revalidar seria pagar duas vezes!
+    response_model=None,
     summary="Listar estoque baixo",
     description="Retorna medicamentos com estoque crítico ou abaixo do mínimo"
 )
-def listar_estoque_baixo(session: Session = Depends(get_session)):
+def listar_estoque_baixo(
+    medicamento_repo: MedicamentoRepositoryPostgres = Depends(get_medicamento_repo),
+    lote_repo: LoteRepositoryPostgres = Depends(get_lote_repo)
+):
     """
     Lista todos os medicamentos com estoque baixo
     
@@ -373,28 +368,14 @@ def listar_estoque_baixo(session: Session = Depends(get_session)):
     
     Ordenado por prioridade (críticos primeiro)
     """
-    try:
-        # 1. Criar repositórios
-        medicamento_repo = MedicamentoRepositoryPostgres(session)
-        lote_repo = LoteRepositoryPostgres(session)
-        
-        # 2. Criar use case
-        use_case = VerificarEstoqueBaixoUseCase(medicamento_repo, lote_repo)
-        
-        # 3. Executar
-        alertas = use_case.execute()
-        
-        # 4. Converter para schema
-        return [
-            EstoqueBaixoItem(**alerta)
-            for alerta in alertas
-        ]
-        
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Erro ao verificar estoque baixo: {str(e)}"
-        )
+    # 1. Criar use case (repositórios vêm injetados pelo Depends)
+    use_case = VerificarEstoqueBaixoUseCase(medicamento_repo, lote_repo)
+
+    # 2. Executar (erro inesperado → handler global)
+    alertas = use_case.execute()
+
+    # 3. Converter para schema (lista inteira numa chamada só)
+    return _ESTOQUE_BAIXO_ADAPTER.validate_python(alertas)
     
 @router.post(
     "/com-lote",
@@ -405,7 +386,8 @@ def listar_estoque_baixo(session: Session = Depends(get_session)):
 )
 def cadastrar_medicamento_com_lote(
     request: CadastrarMedicamentoComLoteRequest,
-    session: Session = Depends(get_session)
+    medicamento_repo: MedicamentoRepositoryPostgres = Depends(get_medicamento_repo),
+    lote_repo: LoteRepositoryPostgres = Depends(get_lote_repo)
 ):
     """
     Cadastra medicamento JÁ COM lote inicial
@@ -432,43 +414,32 @@ def cadastrar_medicamento_com_lote(
     - Dados do lote criado
     - Mensagem de sucesso
     """
-    try:
-        # 1. Criar dependências
-        medicamento_repo = MedicamentoRepositoryPostgres(session)
-        lote_repo = LoteRepositoryPostgres(session)
-        
-        # 2. Executar use case
-        use_case = CadastrarMedicamentoUseCase(
-            repository=medicamento_repo,
-            lote_repository=lote_repo
-        )
-        
-        resultado = use_case.execute_com_lote_inicial(
-            # Dados do medicamento
-            nome=request.nome,
-            principio_ativo=request.principio_ativo,
-            preco=float(request.preco),  # Converte string para float
-            requer_receita=request.requer_receita,
-            estoque_minimo=request.estoque_minimo,
-            # Dados do lote
-            numero_lote=request.numero_lote,
-            quantidade_inicial=request.quantidade_inicial,
-            data_fabricacao=request.data_fabricacao.isoformat(),
-            data_validade=request.data_validade.isoformat(),
-            fornecedor=request.fornecedor
-        )
-        
-        return resultado
-        
-    except ValueError as e:
-        # Erro de validação (ValueError é usado no projeto!)
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
-    except Exception as e:
-        # Erro inesperado
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Erro ao cadastrar medicamento com lote: {str(e)}"
-        )
\ No newline at end of file
+    # 1. Executar use case (repositórios vêm injetados pelo Depends)
+    # ValueError de validação → 400 no handler global (ver main.py)
+    use_case = CadastrarMedicamentoUseCase(
+        repository=medicamento_repo,
+        lote_repository=lote_repo
+    )
+
+    resultado = use_case.execute_com_lote_inicial(
+        # Dados do medicamento
+        nome=request.nome,
+        principio_ativo=request.principio_ativo,
+        preco=request.preco,  # Já chega como Decimal do schema (sem float!)
+        requer_receita=request.requer_receita,
+        estoque_minimo=request.estoque_minimo,
+        # Dados do lote
+        numero_lote=request.numero_lote,
+        quantidade_inicial=request.quantidade_inicial,
+        # O Pydantic já entregou date — nada de isoformat()
+        # pra re-parsear logo em seguida no domínio!
+        data_fabricacao=request.data_fabricacao,
+        data_validade=request.data_validade,
+        fornecedor=request.fornecedor
+    )
+
+    # Dado mudou → caches de catálogo e relatório não valem mais
+    cache_respostas.invalidar("relatorios:")
+    cache_respostas.invalidar("medicamentos:")
+
+    return resultado
\ No newline at end of file
@@ -3,8 +3,7 @@ Controller - Receitas Médicas
 Endpoints REST para validar receitas médicas
 """
 
-from fastapi import APIRouter, HTTPException, Depends, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, status
 
 from ..schemas.receita_schema import (
     ReceitaValidarRequest,
@@ -12,7 +11,7 @@ from ..schemas.receita_schema import (
 )
 from ...application.use_cases import ValidarReceitaUseCase
 from ...adapters.repositories import MedicamentoRepositoryPostgres
-from ...infrastructure.database import get_session
+from ..dependencies import get_medicamento_repo
 
 
 # Criar router do FastAPI
@@ -31,7 +30,7 @@ router = APIRouter(
 )
 def validar_receita(
     dados: ReceitaValidarRequest,
-    session: Session = Depends(get_session)
+    medicamento_repo: MedicamentoRepositoryPostgres = Depends(get_medicamento_repo)
 ):
     """
     Valida uma receita médica
@@ -60,40 +59,24 @@ def validar_receita(
     - **mensagem**: Feedback sobre a validação
     - **motivo**: Se rejeitada, o motivo
     """
-    try:
-        # 1. Criar repositório
-        medicamento_repo = MedicamentoRepositoryPostgres(session)
-        
-        # 2. Criar use case
-        use_case = ValidarReceitaUseCase(medicamento_repo)
-        
-        # 3. Executar
-        resultado = use_case.execute(
-            medicamento_id=dados.medicamento_id,
-            paciente_nome=dados.paciente_nome,
-            paciente_cpf=dados.paciente_cpf,
-            medicamento_nome=dados.medicamento_nome,
-            quantidade=dados.quantidade,
-            dosagem=dados.dosagem,
-            medico_nome=dados.medico_nome,
-            medico_cpf=dados.medico_cpf,
-            medico_crm=dados.medico_crm,
-            data_emissao=dados.data_emissao,
-            dias_validade=dados.dias_validade
-        )
-        
-        # 4. Retornar
-        return ReceitaValidarResponse(**resultado)
-        
-    except ValueError as e:
-        # Erro de validação
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
-    except Exception as e:
-        # Erro inesperado
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Erro ao validar receita: {str(e)}"
-        )
\ No newline at end of file
+    # 1. Criar use case (repositório vem injetado pelo Depends)
+    # ValueError de validação → 400 no handler global (ver main.py)
+    use_case = ValidarReceitaUseCase(medicamento_repo)
+
+    # 2. Executar
+    resultado = use_case.execute(
+        medicamento_id=dados.medicamento_id,
+        paciente_nome=dados.paciente_nome,
+        paciente_cpf=dados.paciente_cpf,
+        medicamento_nome=dados.medicamento_nome,
+        quantidade=dados.quantidade,
+        dosagem=dados.dosagem,
+        medico_nome=dados.medico_nome,
+        medico_cpf=dados.medico_cpf,
+        medico_crm=dados.medico_crm,
+        data_emissao=dados.data_emissao,
+        dias_validade=dados.dias_validade
+    )
+
+    # 3. Retornar
+    return ReceitaValidarResponse(**resultado)
\ No newline at end of file
@@ -4,10 +4,9 @@ Endpoints para consultas e relatórios gerenciais
 """
 
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy.orm import Session
 
-from src.infrastructure.database.base import SessionLocal
 from src.adapters.repositories import MedicamentoRepositoryPostgres, LoteRepositoryPostgres
+from src.api.dependencies import get_medicamento_repo, get_lote_repo
 from src.application.use_cases import (
     RelatorioEstoqueUseCase,
     RelatorioMovimentacoesUseCase,
@@ -18,20 +17,12 @@ from src.api.schemas import (
     RelatorioMovimentacoesResponse,
     MedicamentosVencendoResponse
 )
+from src.api.cache import cache_respostas
 
 
 router = APIRouter(prefix="/relatorios", tags=["Relatórios"])
 
 
-def get_db():
-    """Dependency para obter sessão do banco"""
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
 @router.get(
     "/estoque",
     response_model=RelatorioEstoqueResponse,
@@ -39,13 +30,22 @@ def get_db():
 )
 def relatorio_estoque(
     incluir_zerados: bool = Query(False, description="Incluir produtos zerados"),
-    db: Session = Depends(get_db)
+    medicamento_repo: MedicamentoRepositoryPostgres = Depends(get_medicamento_repo),
+    lote_repo: LoteRepositoryPostgres = Depends(get_lote_repo)
 ):
     """Gera relatório completo do estoque atual"""
-    medicamento_repo = MedicamentoRepositoryPostgres(db)
-    lote_repo = LoteRepositoryPostgres(db)
+    # Cache de 30s: o relatório agrega o estoque inteiro, mas o
+    # dado muda devagar — resposta quente sai sem tocar no banco
+    chave = f"relatorios:estoque:{incluir_zerados}"
+    resposta = cache_respostas.obter(chave)
+    if resposta is not None:
+        return resposta
+
     use_case = RelatorioEstoqueUseCase(medicamento_repo, lote_repo)
-    return use_case.execute(incluir_zerados=incluir_zerados)
+    resposta = use_case.execute(incluir_zerados=incluir_zerados)
+
+    cache_respostas.guardar(chave, resposta)
+    return resposta
 
 
 @router.get(
@@ -55,13 +55,20 @@ def relatorio_estoque(
 )
 def relatorio_movimentacoes(
     dias: int = Query(30, ge=1, le=365, description="Período (dias)"),
-    db: Session = Depends(get_db)
+    medicamento_repo: MedicamentoRepositoryPostgres = Depends(get_medicamento_repo),
+    lote_repo: LoteRepositoryPostgres = Depends(get_lote_repo)
 ):
     """Gera relatório de entradas e saídas no período"""
-    medicamento_repo = MedicamentoRepositoryPostgres(db)
-    lote_repo = LoteRepositoryPostgres(db)
+    chave = f"relatorios:movimentacoes:{dias}"
+    resposta = cache_respostas.obter(chave)
+    if resposta is not None:
+        return resposta
+
     use_case = RelatorioMovimentacoesUseCase(medicamento_repo, lote_repo)
-    return use_case.execute(dias=dias)
+    resposta = use_case.execute(dias=dias)
+
+    cache_respostas.guardar(chave, resposta)
+    return resposta
 
 
 @router.get(
@@ -71,10 +78,17 @@ def relatorio_movimentacoes(
 )
 def medicamentos_vencendo(
     dias: int = Query(60, ge=1, le=365, description="Dias para alertar"),
-    db: Session = Depends(get_db)
+    medicamento_repo: MedicamentoRepositoryPostgres = Depends(get_medicamento_repo),
+    lote_repo: LoteRepositoryPostgres = Depends(get_lote_repo)
 ):
     """Lista medicamentos que vencem nos próximos dias"""
-    medicamento_repo = MedicamentoRepositoryPostgres(db)
-    lote_repo = LoteRepositoryPostgres(db)
+    chave = f"relatorios:vencendo:{dias}"
+    resposta = cache_respostas.obter(chave)
+    if resposta is not None:
+        return resposta
+
     use_case = MedicamentosVencendoUseCase(medicamento_repo, lote_repo)
-    return use_case.execute(dias=dias)
\ No newline at end of file
+    resposta = use_case.execute(dias=dias)
+
+    cache_respostas.guardar(chave, resposta)
+    return resposta
\ No newline at end of file
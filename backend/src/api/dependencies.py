@@ -0,0 +1,45 @@
+"""
+Dependências da API (FastAPI Depends)
+Providers de repositórios compartilhados pelos controllers
+"""
+
+from fastapi import Depends
+from sqlalchemy.orm import Session
+
+from ..adapters.repositories import (
+    MedicamentoRepositoryPostgres,
+    LoteRepositoryPostgres
+)
+from ..infrastructure.database import get_session
+
+
+def get_medicamento_repo(
+    session: Session = Depends(get_session)
+) -> MedicamentoRepositoryPostgres:
+    """
+    Provê o repositório de medicamentos do request
+
+    O FastAPI resolve (e cacheia) a dependência 1 vez por request:
+    todos os endpoints compartilham a MESMA sessão e o mesmo
+    repositório, sem instanciar nada na mão dentro do handler.
+
+    Returns:
+        Repositório de medicamentos ligado à sessão do request
+    """
+    return MedicamentoRepositoryPostgres(session)
+
+
+def get_lote_repo(
+    session: Session = Depends(get_session)
+) -> LoteRepositoryPostgres:
+    """
+    Provê o repositório de lotes do request
+
+    Como get_session também é cacheado pelo FastAPI, este
+    repositório usa a MESMA sessão do repositório de
+    medicamentos no mesmo request (transação única!).
+
+    Returns:
+        Repositório de lotes ligado à sessão do request
+    """
+    return LoteRepositoryPostgres(session)
@@ -3,9 +3,14 @@ API Principal do AlleFarma
 FastAPI Application
 """
 
-from fastapi import FastAPI
+import os
+
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 
+from .cache import cache_respostas
 from .controllers import medicamento_controller, lote_controller, receita_controller
 from src.api.controllers.relatorio_controller import router as relatorio_router
 from src.infrastructure.config import configurar_observers  # NOVO - Aula 12!
@@ -17,20 +22,63 @@ app = FastAPI(
     description="API REST para gestão farmacêutica usando Arquitetura Hexagonal",
     version="1.0.0",
     docs_url="/docs",  # Swagger UI
-    redoc_url="/redoc"  # ReDoc
+    redoc_url="/redoc",  # ReDoc
+    # orjson serializa em C: listas grandes (ex: GET /lotes) saem
+    # 3-5x mais rápido que o json.dumps padrão, pra TODOS os
+    # endpoints de uma vez
+    default_response_class=ORJSONResponse
 )
 
 
 # Configurar CORS (permitir frontend acessar)
+#
+# Origens explícitas (via env CORS_ORIGINS, separadas por vírgula) em
+# vez de "*": com wildcard o navegador manda um OPTIONS de preflight
+# pra CADA request não-simples! Com origem fixa + max_age=86400 o
+# preflight fica cacheado por 1 dia no navegador — corta quase metade
+# das requisições vindas da SPA
+_origens = os.getenv("CORS_ORIGINS", "http://localhost:3000").split(",")
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Em produção, especificar domínios
+    allow_origins=_origens,
     allow_credentials=True,
-    allow_methods=["*"],  # GET, POST, PUT, DELETE...
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "DELETE"],
+    allow_headers=["authorization", "content-type"],
+    max_age=86400,  # preflight cacheado por 24h
 )
 
 
+# Compressão gzip: JSON de relatório é cheio de repetição (nomes,
+# datas...) e encolhe bastante no wire. minimum_size=1024 deixa
+# resposta pequena passar direto (comprimir pouco byte não paga o
+# CPU); compresslevel=5 equilibra taxa × custo de CPU
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+
+# Handlers GLOBAIS de erro: os controllers ficam só com o caminho
+# feliz, sem try/except nenhum por endpoint!
+#
+# ValueError é a exceção de regra de negócio do domínio (convenção
+# do projeto) → vira 400 com a mensagem da regra
+@app.exception_handler(ValueError)
+def erro_dominio_handler(request: Request, exc: ValueError):
+    return JSONResponse(
+        status_code=400,
+        content={"detail": str(exc)}
+    )
+
+
+# Qualquer outra exceção cai aqui, virando 500 com detalhe
+# genérico (sem vazar str(e) pro cliente!)
+@app.exception_handler(Exception)
+def erro_inesperado_handler(request: Request, exc: Exception):
+    return JSONResponse(
+        status_code=500,
+        content={"detail": "Erro interno no servidor"}
+    )
+
+
 # NOVO - Aula 12! Configurar observers na inicialização
 configurar_observers()
 
@@ -42,6 +90,41 @@ app.include_router(receita_controller.router)
 app.include_router(relatorio_router)
 
 
+# Aquecimento de cache na subida: a PRIMEIRA requisição depois do
+# deploy acharia o cache vazio e pagaria a ida fria ao banco. Rodando
+# o caso de uso do catálogo aqui, "medicamentos:lista" já nasce
+# quente. Falha de banco na subida NÃO derruba a API — só loga e
+# deixa o primeiro request popular o cache normalmente
+@app.on_event("startup")
+def aquecer_cache():
+    from time import perf_counter
+
+    from src.adapters.repositories import MedicamentoRepositoryPostgres
+    from src.application.use_cases import ListarMedicamentosUseCase
+    from src.infrastructure.database import SessionLocal
+
+    from .controllers.medicamento_controller import _resposta_confiavel
+
+    inicio = perf_counter()
+    try:
+        session = SessionLocal()
+        try:
+            use_case = ListarMedicamentosUseCase(
+                MedicamentoRepositoryPostgres(session)
+            )
+            resposta = [
+                _resposta_confiavel(medicamento)
+                for medicamento in use_case.execute()
+            ]
+            cache_respostas.guardar("medicamentos:lista", resposta)
+        finally:
+            session.close()
+        duracao_ms = (perf_counter() - inicio) * 1000
+        print(f"🔥 Cache aquecido: medicamentos:lista ({duracao_ms:.1f}ms)")
+    except Exception as e:
+        print(f"⚠️ Aquecimento de cache pulado: {e}")
+
+
 @app.get("/", tags=["Root"])
 def root():
     """
@@ -61,10 +144,38 @@ def root():
 def health_check():
     """
     Health check
-    
+
     Verifica se a API está funcionando
     """
     return {
         "status": "healthy",
         "service": "AlleFarma API"
-    }
\ No newline at end of file
+    }
+
+
+@app.get("/metrics", tags=["Health"])
+def metrics():
+    """
+    Métricas do cache de respostas
+
+    Acertos vs faltas mostram se o TTL está valendo a pena:
+    taxa de acerto baixa = cache invalidando demais (ou TTL curto)
+    """
+    total = cache_respostas.acertos + cache_respostas.faltas
+    return {
+        "cache_hits_total": cache_respostas.acertos,
+        "cache_misses_total": cache_respostas.faltas,
+        "cache_hit_rate": (
+            cache_respostas.acertos / total if total else 0.0
+        )
+    }
+
+
+# Pré-computar o schema OpenAPI: a geração varre TODOS os schemas
+# Pydantic da API (medicamento, lote, receita, relatórios...) — caro!
+# Feito aqui na subida, o primeiro /docs ou /openapi.json não paga
+# nada (app.openapi() guarda o resultado em app.openapi_schema).
+# IMPORTANTE: precisa ficar DEPOIS da última rota — o schema é
+# cacheado na primeira geração, então rota definida depois ficaria
+# de fora do /docs pra sempre!
+app.openapi()
\ No newline at end of file
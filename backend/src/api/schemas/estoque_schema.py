@@ -3,9 +3,25 @@ Schemas Pydantic - Estoque
 Define estrutura de dados para operações de estoque
 """
 
-from typing import Optional, Literal
+from typing import Final, Optional, Literal
 from pydantic import BaseModel, Field
 
+# Exemplos do OpenAPI como constantes de módulo (criados uma vez só;
+# ver medicamento_schema.py)
+_ADICIONAR_ESTOQUE_EXAMPLE: Final[dict] = {
+    "quantidade": 200,
+    "numero_lote": "LOTE-2024-001",
+    "data_fabricacao": "2024-01-15",
+    "data_validade": "2026-01-15",
+    "fornecedor": "Farmacêutica ABC Ltda"
+}
+
+_REMOVER_ESTOQUE_EXAMPLE: Final[dict] = {
+    "quantidade": 10,
+    "motivo": "VENDA",
+    "observacao": "Venda para cliente João Silva"
+}
+
 
 class AdicionarEstoqueRequest(BaseModel):
     """
@@ -43,15 +59,7 @@ class AdicionarEstoqueRequest(BaseModel):
     
     class Config:
         """Configurações do schema"""
-        json_schema_extra = {
-            "example": {
-                "quantidade": 200,
-                "numero_lote": "LOTE-2024-001",
-                "data_fabricacao": "2024-01-15",
-                "data_validade": "2026-01-15",
-                "fornecedor": "Farmacêutica ABC Ltda"
-            }
-        }
+        json_schema_extra = {"example": _ADICIONAR_ESTOQUE_EXAMPLE}
 
 
 class RemoverEstoqueRequest(BaseModel):
@@ -77,13 +85,7 @@ class RemoverEstoqueRequest(BaseModel):
     
     class Config:
         """Configurações do schema"""
-        json_schema_extra = {
-            "example": {
-                "quantidade": 10,
-                "motivo": "VENDA",
-                "observacao": "Venda para cliente João Silva"
-            }
-        }
+        json_schema_extra = {"example": _REMOVER_ESTOQUE_EXAMPLE}
 
 
 class EstoqueResponse(BaseModel):
@@ -3,11 +3,22 @@ Schemas Pydantic - Lote
 Define estrutura de dados da API
 """
 
-from typing import Optional
+from typing import Final, Optional
 from datetime import date
 
 from pydantic import BaseModel, Field
 
+# Exemplo do OpenAPI como constante de módulo (criado uma vez só;
+# ver medicamento_schema.py)
+_LOTE_CREATE_EXAMPLE: Final[dict] = {
+    "numero_lote": "LOTE-2024-001",
+    "medicamento_id": 1,
+    "quantidade": 500,
+    "data_fabricacao": "2024-01-15",
+    "data_validade": "2026-01-15",
+    "fornecedor": "Farmacêutica ABC"
+}
+
 
 class LoteCreate(BaseModel):
     """
@@ -48,16 +59,7 @@ class LoteCreate(BaseModel):
     
     class Config:
         """Configurações do schema"""
-        json_schema_extra = {
-            "example": {
-                "numero_lote": "LOTE-2024-001",
-                "medicamento_id": 1,
-                "quantidade": 500,
-                "data_fabricacao": "2024-01-15",
-                "data_validade": "2026-01-15",
-                "fornecedor": "Farmacêutica ABC"
-            }
-        }
+        json_schema_extra = {"example": _LOTE_CREATE_EXAMPLE}
 
 
 class LoteResponse(BaseModel):
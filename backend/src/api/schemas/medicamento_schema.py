@@ -3,11 +3,40 @@ Schemas Pydantic - Medicamento
 Define estrutura de dados da API
 """
 
-from typing import Optional, Dict, Any
-from decimal import Decimal, InvalidOperation
+from typing import Annotated, Final, Optional, Dict, Any, TypedDict
+from decimal import Decimal
 from datetime import date
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, PlainSerializer, field_validator
+
+# Decimal serializado como string ("8.50") — o PlainSerializer é
+# compilado junto com o schema, substituindo o json_encoders legado
+# (deprecado no Pydantic v2, que chamava um lambda por valor!)
+PrecoStr = Annotated[Decimal, PlainSerializer(str, return_type=str)]
+
+# Exemplos do OpenAPI como constantes de módulo: o dict é criado UMA
+# vez no import (não a cada rebuild da classe) e a montagem do
+# /openapi.json referencia o mesmo objeto em vez de copiar literais
+_MEDICAMENTO_CREATE_EXAMPLE: Final[dict] = {
+    "nome": "Dipirona 500mg",
+    "principio_ativo": "Dipirona Sódica",
+    "preco": "8.50",
+    "estoque_minimo": 100,
+    "requer_receita": False
+}
+
+_MEDICAMENTO_COM_LOTE_EXAMPLE: Final[dict] = {
+    "nome": "Dipirona 500mg",
+    "principio_ativo": "Dipirona Sódica",
+    "preco": "8.50",
+    "requer_receita": False,
+    "estoque_minimo": 100,
+    "numero_lote": "LOTE-2026-001",
+    "quantidade_inicial": 500,
+    "data_fabricacao": "2026-01-15",
+    "data_validade": "2028-01-15",
+    "fornecedor": "Farmacêutica ABC"
+}
 
 
 class MedicamentoCreate(BaseModel):
@@ -43,27 +72,29 @@ class MedicamentoCreate(BaseModel):
         description="Se o medicamento requer receita médica (controlado)"
     )
 
-    @field_validator('preco', mode='before')
-    @classmethod
-    def converter_preco(cls, v):
-        """Converte string para Decimal se necessário"""
-        if isinstance(v, str):
-            try:
-                return Decimal(v)
-            except (InvalidOperation, ValueError):
-                raise ValueError(f"Preço inválido: '{v}'. Use formato numérico (ex: 10.50)")
-        return v
+    # 💡 Sem field_validator pro preço: o pydantic-core (Rust) já
+    # converte string → Decimal nativamente — um validator Python
+    # aqui seria um callback interpretado POR REQUISIÇÃO só pra
+    # refazer o que o núcleo compilado faz de graça!
 
     class Config:
-        json_schema_extra = {
-            "example": {
-                "nome": "Dipirona 500mg",
-                "principio_ativo": "Dipirona Sódica",
-                "preco": "8.50",
-                "estoque_minimo": 100,
-                "requer_receita": False
-            }
-        }
+        json_schema_extra = {"example": _MEDICAMENTO_CREATE_EXAMPLE}
+
+
+class MedicamentoDict(TypedDict):
+    """
+    Forma de dicionário do medicamento pro caminho quente de listagem
+
+    TypedDict é só anotação: em runtime é um dict puro — zero custo
+    de instanciar classe por item, e o orjson serializa dict direto.
+    Mesmos campos (e mesma serialização) do MedicamentoResponse!
+    """
+    id: int
+    nome: str
+    principio_ativo: str
+    preco: str
+    estoque_minimo: int
+    requer_receita: bool
 
 
 class MedicamentoResponse(BaseModel):
@@ -75,23 +106,12 @@ class MedicamentoResponse(BaseModel):
     id: int
     nome: str
     principio_ativo: str
-    preco: Decimal
+    preco: PrecoStr
     estoque_minimo: int
     requer_receita: bool
 
-    @field_validator('preco', mode='before')
-    @classmethod
-    def converter_preco_response(cls, v):
-        """Converte string para Decimal se vier do banco"""
-        if isinstance(v, str):
-            return Decimal(v)
-        return v
-
     class Config:
         from_attributes = True
-        json_encoders = {
-            Decimal: lambda v: str(v)
-        }
 
 
 class MedicamentoUpdate(BaseModel):
@@ -106,24 +126,18 @@ class MedicamentoUpdate(BaseModel):
     estoque_minimo: Optional[int] = Field(None, gt=0)
     requer_receita: Optional[bool] = None
 
-    @field_validator('preco', mode='before')
-    @classmethod
-    def converter_preco_update(cls, v):
-        """Converte string para Decimal se necessário"""
-        if v is not None and isinstance(v, str):
-            try:
-                return Decimal(v)
-            except (InvalidOperation, ValueError):
-                raise ValueError(f"Preço inválido: '{v}'. Use formato numérico (ex: 10.50)")
-        return v
-
 
 class CadastrarMedicamentoComLoteRequest(BaseModel):
     """Schema para cadastrar medicamento com lote inicial"""
     # Dados do medicamento
     nome: str = Field(..., min_length=3, max_length=200)
     principio_ativo: str = Field(..., min_length=3, max_length=200)
-    preco: str = Field(..., pattern=r'^\d+(\.\d{2})?$', description="Preço no formato decimal (ex: 10.50)")
+    # Decimal direto: o pydantic-core aceita string JSON e converte
+    # em Rust — o pattern regex anterior validava o formato só pra
+    # string ser re-parseada pelo Decimal logo depois (2x o trabalho,
+    # e o regex exigia exatamente 2 casas enquanto o resto do projeto
+    # aceita qualquer precisão!)
+    preco: Decimal = Field(..., gt=0, description="Preço no formato decimal (ex: 10.50)")
     requer_receita: bool = False
     estoque_minimo: Optional[int] = Field(None, gt=0, description="Estoque mínimo (padrão: 50)")
 
@@ -151,20 +165,7 @@ class CadastrarMedicamentoComLoteRequest(BaseModel):
         return v
 
     class Config:
-        json_schema_extra = {
-            "example": {
-                "nome": "Dipirona 500mg",
-                "principio_ativo": "Dipirona Sódica",
-                "preco": "8.50",
-                "requer_receita": False,
-                "estoque_minimo": 100,
-                "numero_lote": "LOTE-2026-001",
-                "quantidade_inicial": 500,
-                "data_fabricacao": "2026-01-15",
-                "data_validade": "2028-01-15",
-                "fornecedor": "Farmacêutica ABC"
-            }
-        }
+        json_schema_extra = {"example": _MEDICAMENTO_COM_LOTE_EXAMPLE}
 
 
 class CadastrarMedicamentoComLoteResponse(BaseModel):
@@ -3,9 +3,34 @@ Schemas Pydantic - Receita Médica
 Define estrutura de dados para validação de receitas
 """
 
-from typing import Optional
+from typing import Final, Optional
 from pydantic import BaseModel, Field
 
+# Padrões declarados UMA vez no módulo (CPF aparecia duplicado em
+# dois Fields!). Passados via Field(pattern=...), o pydantic-core
+# compila cada um UMA única vez no build do schema, com a engine de
+# regex do Rust: matching em tempo linear, sem backtracking e sem
+# callback Python por requisição
+_CPF_PATTERN = r'^\d{3}\.?\d{3}\.?\d{3}-?\d{2}$'
+_CRM_PATTERN = r'^\d{4,7}/[A-Z]{2}$'
+_DATA_PATTERN = r'^\d{4}-\d{2}-\d{2}$'
+
+# Exemplo do OpenAPI como constante de módulo (criado uma vez só;
+# ver medicamento_schema.py)
+_RECEITA_VALIDAR_EXAMPLE: Final[dict] = {
+    "medicamento_id": 1,
+    "paciente_nome": "João da Silva",
+    "paciente_cpf": "123.456.789-09",
+    "medicamento_nome": "Rivotril 2mg",
+    "quantidade": 30,
+    "dosagem": "1 comprimido 2x ao dia",
+    "medico_nome": "Dr. Carlos Souza",
+    "medico_cpf": "987.654.321-00",
+    "medico_crm": "123456/SP",
+    "data_emissao": "2026-02-01",
+    "dias_validade": 30
+}
+
 
 class ReceitaValidarRequest(BaseModel):
     """
@@ -28,7 +53,7 @@ class ReceitaValidarRequest(BaseModel):
     )
     paciente_cpf: str = Field(
         ...,
-        pattern=r'^\d{3}\.?\d{3}\.?\d{3}-?\d{2}$',
+        pattern=_CPF_PATTERN,
         description="CPF do paciente (com ou sem formatação)"
     )
     
@@ -60,19 +85,19 @@ class ReceitaValidarRequest(BaseModel):
     )
     medico_cpf: str = Field(
         ...,
-        pattern=r'^\d{3}\.?\d{3}\.?\d{3}-?\d{2}$',
+        pattern=_CPF_PATTERN,
         description="CPF do médico (com ou sem formatação)"
     )
     medico_crm: str = Field(
         ...,
-        pattern=r'^\d{4,7}/[A-Z]{2}$',
+        pattern=_CRM_PATTERN,
         description="CRM do médico no formato 123456/UF"
     )
     
     # Datas
     data_emissao: str = Field(
         ...,
-        pattern=r'^\d{4}-\d{2}-\d{2}$',
+        pattern=_DATA_PATTERN,
         description="Data de emissão da receita (YYYY-MM-DD)"
     )
     dias_validade: int = Field(
@@ -84,21 +109,7 @@ class ReceitaValidarRequest(BaseModel):
     
     class Config:
         """Configurações do schema"""
-        json_schema_extra = {
-            "example": {
-                "medicamento_id": 1,
-                "paciente_nome": "João da Silva",
-                "paciente_cpf": "123.456.789-09",
-                "medicamento_nome": "Rivotril 2mg",
-                "quantidade": 30,
-                "dosagem": "1 comprimido 2x ao dia",
-                "medico_nome": "Dr. Carlos Souza",
-                "medico_cpf": "987.654.321-00",
-                "medico_crm": "123456/SP",
-                "data_emissao": "2026-02-01",
-                "dias_validade": 30
-            }
-        }
+        json_schema_extra = {"example": _RECEITA_VALIDAR_EXAMPLE}
 
 
 class ReceitaValidarResponse(BaseModel):
@@ -1,28 +1,39 @@
 """
 Use Cases do AlleFarma
 Casos de uso que implementam a lógica de negócio
+
+Imports LAZY (PEP 562): importar o pacote não puxa os 10 use cases
+(e, transitivamente, SQLAlchemy, entidades...) de uma vez — cada
+classe só é importada no PRIMEIRO acesso. Processo que usa 2 use
+cases paga o custo de 2, não de 10: cold start mais leve!
 """
 
-from .cadastrar_medicamento_use_case import CadastrarMedicamentoUseCase
-from .listar_medicamentos_use_case import ListarMedicamentosUseCase
-from .adicionar_estoque_use_case import AdicionarEstoqueUseCase
-from .remover_estoque_use_case import RemoverEstoqueUseCase
-from .verificar_estoque_baixo_use_case import VerificarEstoqueBaixoUseCase
-from .validar_receita_use_case import ValidarReceitaUseCase
-from .relatorio_estoque_use_case import RelatorioEstoqueUseCase
-from .relatorio_movimentacoes_use_case import RelatorioMovimentacoesUseCase
-from .medicamentos_vencendo_use_case import MedicamentosVencendoUseCase
-from .monitorar_produtos_vencendo_use_case import MonitorarProdutosVencendoUseCase  # NOVO - Aula 12!
+from importlib import import_module
+
+# Classe → módulo onde ela mora
+_LAZY = {
+    'CadastrarMedicamentoUseCase': 'cadastrar_medicamento_use_case',
+    'ListarMedicamentosUseCase': 'listar_medicamentos_use_case',
+    'AdicionarEstoqueUseCase': 'adicionar_estoque_use_case',
+    'RemoverEstoqueUseCase': 'remover_estoque_use_case',
+    'VerificarEstoqueBaixoUseCase': 'verificar_estoque_baixo_use_case',
+    'ValidarReceitaUseCase': 'validar_receita_use_case',
+    'RelatorioEstoqueUseCase': 'relatorio_estoque_use_case',
+    'RelatorioMovimentacoesUseCase': 'relatorio_movimentacoes_use_case',
+    'MedicamentosVencendoUseCase': 'medicamentos_vencendo_use_case',
+    'MonitorarProdutosVencendoUseCase': 'monitorar_produtos_vencendo_use_case',  # NOVO - Aula 12!
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    """Resolve o use case no primeiro acesso (e cacheia no módulo)"""
+    modulo = _LAZY.get(name)
+    if modulo is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-__all__ = [
-    'CadastrarMedicamentoUseCase',
-    'ListarMedicamentosUseCase',
-    'AdicionarEstoqueUseCase',
-    'RemoverEstoqueUseCase',
-    'VerificarEstoqueBaixoUseCase',
-    'ValidarReceitaUseCase',
-    'RelatorioEstoqueUseCase',
-    'RelatorioMovimentacoesUseCase',
-    'MedicamentosVencendoUseCase',
-    'MonitorarProdutosVencendoUseCase',  # NOVO - Aula 12!
-]
\ No newline at end of file
+    classe = getattr(import_module(f'.{modulo}', __name__), name)
+    # Guardar no namespace do pacote: próximo acesso nem passa aqui
+    globals()[name] = classe
+    return classe
@@ -3,7 +3,7 @@ Use Case: Adicionar Estoque
 Responsável por adicionar produtos ao estoque (entrada)
 """
 
-from datetime import datetime
+from datetime import date
 from typing import Dict, Any
 
 from src.domain.entities import Lote
@@ -79,18 +79,21 @@ class AdicionarEstoqueUseCase:
         if not medicamento:
             raise ValueError(f"Medicamento {medicamento_id} não encontrado!")
         
-        # 3. Converter datas
+        # 3. Converter datas (fromisoformat é implementado em C e
+        # parseia direto — strptime interpreta o format string em
+        # Python a CADA chamada!)
         try:
-            data_fab = datetime.strptime(data_fabricacao, "%Y-%m-%d").date()
-            data_val = datetime.strptime(data_validade, "%Y-%m-%d").date()
+            data_fab = date.fromisoformat(data_fabricacao)
+            data_val = date.fromisoformat(data_validade)
         except ValueError as e:
             raise ValueError(f"Formato de data inválido: {str(e)}")
         
-        # 4. Validar datas
+        # 4. Validar datas (date.today() direto — sem construir um
+        # datetime inteiro só pra descartar a hora!)
         if data_val <= data_fab:
             raise ValueError("Data de validade deve ser posterior à fabricação!")
-        
-        if data_val <= datetime.now().date():
+
+        if data_val <= date.today():
             raise ValueError("Data de validade deve ser futura!")
         
         # 5. Criar novo lote
@@ -106,14 +109,19 @@ class AdicionarEstoqueUseCase:
         # 6. Salvar lote
         lote_salvo = self.lote_repo.salvar(lote)
         
-        # 7. Calcular estoque total atualizado
-        todos_lotes = self.lote_repo.buscar_por_medicamento(medicamento_id)
-        estoque_total = sum(lote.quantidade for lote in todos_lotes)
+        # 7. Calcular estoque total atualizado — o banco soma e
+        # devolve só o escalar (antes: N lotes hidratados + sum em
+        # Python a cada entrada de estoque!)
+        estoque_total = self.lote_repo.somar_quantidade_por_medicamento(
+            medicamento_id
+        )
         
-        # 8. Determinar status
-        if estoque_total < medicamento.estoque_minimo:
+        # 8. Determinar status (atributo lido UMA vez pra local —
+        # LOAD_FAST em vez de dois lookups de atributo)
+        estoque_minimo = medicamento.estoque_minimo
+        if estoque_total < estoque_minimo:
             status = "ATENCAO"
-            mensagem = f"Estoque ainda abaixo do mínimo ({medicamento.estoque_minimo})"
+            mensagem = f"Estoque ainda abaixo do mínimo ({estoque_minimo})"
         else:
             status = "OK"
             mensagem = "Estoque adequado"
@@ -128,7 +136,7 @@ class AdicionarEstoqueUseCase:
                 "quantidade": lote_salvo.quantidade
             },
             "estoque_atual": estoque_total,
-            "estoque_minimo": medicamento.estoque_minimo,
+            "estoque_minimo": estoque_minimo,
             "status": status,
             "mensagem": mensagem
         }
\ No newline at end of file
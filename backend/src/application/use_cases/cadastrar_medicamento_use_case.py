@@ -4,8 +4,9 @@ Coordena o processo de cadastrar um novo medicamento no sistema
 Agora com Factory Pattern! 🏭
 """
 
+from datetime import date
 from decimal import Decimal
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Union
 
 from src.domain.entities import Medicamento, Lote
 from src.domain.ports import MedicamentoRepositoryPort, LoteRepositoryPort
@@ -56,18 +57,15 @@ class CadastrarMedicamentoUseCase:
         Raises:
             ValueError: Se dados inválidos (regras do domínio)
         """
-        # Converter preço para float (Factory espera float)
-        preco = dados['preco']
-        if isinstance(preco, Decimal):
-            preco = float(preco)
-        elif isinstance(preco, str):
-            preco = float(preco)
-        
         # USAR FACTORY para criar medicamento! 🏭
+        # O preço vai direto: a Factory normaliza com Decimal(str(...)),
+        # que aceita str/float/Decimal — a escada de isinstance que
+        # convertia pra float aqui era trabalho extra E arredondava
+        # um valor monetário sem necessidade!
         medicamento = MedicamentoFactory.criar(
             nome=dados['nome'],
             principio_ativo=dados['principio_ativo'],
-            preco=preco,
+            preco=dados['preco'],
             estoque_minimo=dados.get('estoque_minimo'),  # Usa padrão da Factory se None
             controlado=dados.get('requer_receita', False)  # Compatível com campo atual
         )
@@ -83,21 +81,25 @@ class CadastrarMedicamentoUseCase:
         # Dados do medicamento
         nome: str,
         principio_ativo: str,
-        preco: float,
+        preco: Union[str, float, Decimal],
         requer_receita: bool,
         estoque_minimo: Optional[int],
         # Dados do lote
         numero_lote: str,
         quantidade_inicial: int,
-        data_fabricacao: str,
-        data_validade: str,
+        data_fabricacao: date,
+        data_validade: date,
         fornecedor: str
     ) -> Dict[str, Any]:
         """
         Cadastra medicamento JÁ COM lote inicial
-        
+
         Usa Factory.criar_com_lote_inicial()! 🏭
-        
+
+        As datas chegam como date (o Pydantic já validou na borda) e
+        o preço segue como str/Decimal — sem passar por float, que
+        arredonda, nem re-parsear string que já foi parseada!
+
         Novo método adicionado na Aula 12!
         """
         if not self.lote_repository:
@@ -3,11 +3,26 @@ Use Case: Medicamentos Vencendo
 Lista medicamentos que estão próximos da data de validade
 """
 
+from bisect import bisect_left
 from typing import Dict, List, Any
 from datetime import date, timedelta
+from decimal import Decimal
 
 from src.domain.ports import LoteRepositoryPort, MedicamentoRepositoryPort
 
+# Tabelas de classificação por faixa de dias restantes:
+# ≤15 → CRITICA, ≤30 → ALTA, resto → MEDIA.
+# bisect acha a faixa com UMA busca binária — sem cascata de
+# if/elif repetida por produto E por lote!
+_LIMIARES_URGENCIA = (15, 30)
+_URGENCIAS = ("CRITICA", "ALTA", "MEDIA")
+_PRIORIDADES = (1, 2, 3)
+_ACOES_SUGERIDAS = (
+    "🚨 URGENTE: Fazer promoção agressiva! {quantidade} unidades em risco",
+    "⚠️ Fazer promoção ou desconto. {quantidade} unidades precisam sair",
+    "📋 Monitorar. {quantidade} unidades ainda têm tempo",
+)
+
 
 class MedicamentosVencendoUseCase:
     """
@@ -40,23 +55,36 @@ class MedicamentosVencendoUseCase:
             Dicionário com produtos vencendo
         """
         # 1. Calcular data limite
-        data_limite = date.today() + timedelta(days=dias)
+        # date.today() desce até syscall — pega 1 vez e reusa no
+        # request inteiro (inclusive dentro do loop de lotes!)
+        hoje = date.today()
+        data_limite = hoje + timedelta(days=dias)
         
         # 2. Buscar lotes que vencem no período
         lotes_vencendo = self.lote_repository.listar_vencendo_em(dias)
-        
-        # 3. Agrupar por medicamento
+
+        # 3. Buscar os medicamentos referenciados numa chamada SÓ —
+        # antes eram DUAS buscas por lote dentro do loop (N+1 em
+        # dobro!); agora é 1 SELECT ... IN e lookups de dict
+        ids_medicamentos = {lote.medicamento_id for lote in lotes_vencendo}
+        medicamentos_por_id = {
+            medicamento.id: medicamento
+            for medicamento in self.medicamento_repository.buscar_por_ids(
+                ids_medicamentos
+            )
+        }
+
+        # 4. Agrupar por medicamento
         medicamentos_dict = {}
-        
+
         for lote in lotes_vencendo:
             medicamento_id = lote.medicamento_id
-            
+
+            medicamento = medicamentos_por_id.get(medicamento_id)
+            if not medicamento:
+                continue
+
             if medicamento_id not in medicamentos_dict:
-                # Buscar info do medicamento
-                medicamento = self.medicamento_repository.buscar_por_id(medicamento_id)
-                if not medicamento:
-                    continue
-                
                 medicamentos_dict[medicamento_id] = {
                     "medicamento_id": medicamento_id,
                     "nome": medicamento.nome,
@@ -64,21 +92,23 @@ class MedicamentosVencendoUseCase:
                     "preco_unitario": float(medicamento.preco),
                     "lotes": [],
                     "quantidade_total": 0,
-                    "valor_total": 0,
+                    # Acumulado em Decimal: float() por lote alocava
+                    # um objeto novo a cada soma — converte pra float
+                    # UMA vez só, na montagem do relatório
+                    "valor_total": Decimal("0"),
                     "dias_ate_primeiro_vencimento": None
                 }
             
             # Calcular dias até vencimento
-            dias_restantes = (lote.data_validade - date.today()).days
+            dias_restantes = (lote.data_validade - hoje).days
             
             # Atualizar dias até primeiro vencimento
             if (medicamentos_dict[medicamento_id]["dias_ate_primeiro_vencimento"] is None or
                 dias_restantes < medicamentos_dict[medicamento_id]["dias_ate_primeiro_vencimento"]):
                 medicamentos_dict[medicamento_id]["dias_ate_primeiro_vencimento"] = dias_restantes
             
-            # Calcular valor do lote
-            medicamento = self.medicamento_repository.buscar_por_id(medicamento_id)
-            valor_lote = medicamento.preco * lote.quantidade if medicamento else 0
+            # Calcular valor do lote (mesmo medicamento já em mãos)
+            valor_lote = medicamento.preco * lote.quantidade
             
             # Adicionar lote
             medicamentos_dict[medicamento_id]["lotes"].append({
@@ -86,52 +116,63 @@ class MedicamentosVencendoUseCase:
                 "quantidade": lote.quantidade,
                 "data_validade": lote.data_validade.isoformat(),
                 "dias_restantes": dias_restantes,
-                "urgencia": self._classificar_urgencia(dias_restantes)
+                "urgencia": _URGENCIAS[
+                    bisect_left(_LIMIARES_URGENCIA, dias_restantes)
+                ]
             })
             
             medicamentos_dict[medicamento_id]["quantidade_total"] += lote.quantidade
-            medicamentos_dict[medicamento_id]["valor_total"] += float(valor_lote)
+            medicamentos_dict[medicamento_id]["valor_total"] += valor_lote
         
-        # 4. Converter para lista
+        # 5. Converter para lista
         produtos_vencendo = list(medicamentos_dict.values())
         
-        # 5. Classificar urgência de cada produto
+        # 6. Classificar urgência e acumular estatísticas numa
+        # passada SÓ — antes eram 6 varreduras da mesma lista
+        # (classificação + 2 sum + 3 contagens por urgência)!
+        quantidade_total = 0
+        valor_total = Decimal("0")
+        urgencia_critica = 0
+        urgencia_alta = 0
+        urgencia_media = 0
+
         for produto in produtos_vencendo:
             dias_restantes = produto["dias_ate_primeiro_vencimento"]
-            produto["urgencia"] = self._classificar_urgencia(dias_restantes)
-            produto["prioridade"] = self._calcular_prioridade(dias_restantes)
-            produto["acao_sugerida"] = self._sugerir_acao(dias_restantes, produto["quantidade_total"])
-        
-        # 6. Ordenar por prioridade (mais urgente primeiro)
+            # Uma busca na tabela resolve urgência, prioridade e
+            # ação de uma vez (antes: 3 chamadas de método)
+            faixa = bisect_left(_LIMIARES_URGENCIA, dias_restantes)
+            urgencia = _URGENCIAS[faixa]
+            produto["urgencia"] = urgencia
+            produto["prioridade"] = _PRIORIDADES[faixa]
+            produto["acao_sugerida"] = _ACOES_SUGERIDAS[faixa].format(
+                quantidade=produto["quantidade_total"]
+            )
+
+            quantidade_total += produto["quantidade_total"]
+            valor_total += produto["valor_total"]
+            # float só na saída (o JSON da resposta usa float)
+            produto["valor_total"] = float(produto["valor_total"])
+            if urgencia == "CRITICA":
+                urgencia_critica += 1
+            elif urgencia == "ALTA":
+                urgencia_alta += 1
+            else:
+                urgencia_media += 1
+
+        # 7. Ordenar por prioridade (mais urgente primeiro)
         produtos_vencendo.sort(key=lambda x: x["prioridade"])
         
-        # 7. Calcular estatísticas
-        if produtos_vencendo:
-            quantidade_total = sum(p["quantidade_total"] for p in produtos_vencendo)
-            valor_total = sum(p["valor_total"] for p in produtos_vencendo)
-            
-            # Contar por urgência
-            urgencia_critica = sum(1 for p in produtos_vencendo if p["urgencia"] == "CRITICA")
-            urgencia_alta = sum(1 for p in produtos_vencendo if p["urgencia"] == "ALTA")
-            urgencia_media = sum(1 for p in produtos_vencendo if p["urgencia"] == "MEDIA")
-        else:
-            quantidade_total = 0
-            valor_total = 0
-            urgencia_critica = 0
-            urgencia_alta = 0
-            urgencia_media = 0
-        
         # 8. Montar relatório final
         relatorio = {
             "periodo_analise": {
-                "data_consulta": date.today().isoformat(),
+                "data_consulta": hoje.isoformat(),
                 "dias_analisados": dias,
                 "data_limite": data_limite.isoformat()
             },
             "resumo": {
                 "total_produtos": len(produtos_vencendo),
                 "quantidade_total": quantidade_total,
-                "valor_total_risco": valor_total,
+                "valor_total_risco": float(valor_total),
                 "por_urgencia": {
                     "critica": urgencia_critica,
                     "alta": urgencia_alta,
@@ -142,39 +183,12 @@ class MedicamentosVencendoUseCase:
             "alertas": self._gerar_alertas_gerenciais(
                 urgencia_critica,
                 urgencia_alta,
-                valor_total
+                float(valor_total)
             )
         }
         
         return relatorio
     
-    def _classificar_urgencia(self, dias_restantes: int) -> str:
-        """Classifica urgência baseado nos dias restantes"""
-        if dias_restantes <= 15:
-            return "CRITICA"
-        elif dias_restantes <= 30:
-            return "ALTA"
-        else:
-            return "MEDIA"
-    
-    def _calcular_prioridade(self, dias_restantes: int) -> int:
-        """Calcula prioridade numérica (menor = mais urgente)"""
-        if dias_restantes <= 15:
-            return 1
-        elif dias_restantes <= 30:
-            return 2
-        else:
-            return 3
-    
-    def _sugerir_acao(self, dias_restantes: int, quantidade: int) -> str:
-        """Sugere ação baseado na urgência"""
-        if dias_restantes <= 15:
-            return f"🚨 URGENTE: Fazer promoção agressiva! {quantidade} unidades em risco"
-        elif dias_restantes <= 30:
-            return f"⚠️ Fazer promoção ou desconto. {quantidade} unidades precisam sair"
-        else:
-            return f"📋 Monitorar. {quantidade} unidades ainda têm tempo"
-    
     def _gerar_alertas_gerenciais(
         self,
         urgencia_critica: int,
@@ -63,14 +63,18 @@ class MonitorarProdutosVencendoUseCase:
                 
                 if not medicamento:
                     continue
-                
+
+                # isoformat aloca uma string nova a cada chamada —
+                # formata UMA vez e reusa no evento e na resposta
+                data_validade_iso = lote.data_validade.isoformat()
+
                 # 🔥 DISPARAR EVENTO! (Observer Pattern)
                 evento = ProdutoVencendoEvent(
                     medicamento_id=medicamento.id,
                     nome_medicamento=medicamento.nome,
                     lote_id=lote.id,
                     numero_lote=lote.numero_lote,
-                    data_validade=lote.data_validade.isoformat(),
+                    data_validade=data_validade_iso,
                     dias_ate_vencer=dias_ate_vencer,
                     quantidade=lote.quantidade
                 )
@@ -87,7 +91,7 @@ class MonitorarProdutosVencendoUseCase:
                         "id": lote.id,
                         "numero_lote": lote.numero_lote,
                         "quantidade": lote.quantidade,
-                        "data_validade": lote.data_validade.isoformat(),
+                        "data_validade": data_validade_iso,
                         "dias_ate_vencer": dias_ate_vencer
                     },
                     "urgencia": "CRITICO" if dias_ate_vencer <= 7 else "ATENCAO"
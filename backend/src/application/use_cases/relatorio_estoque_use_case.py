@@ -4,6 +4,7 @@ Gera relatório completo do estoque atual da farmácia
 """
 
 from typing import Dict, List, Any
+from datetime import date
 from decimal import Decimal
 
 from src.domain.ports import MedicamentoRepositoryPort, LoteRepositoryPort
@@ -12,10 +13,10 @@ from src.domain.ports import MedicamentoRepositoryPort, LoteRepositoryPort
 class RelatorioEstoqueUseCase:
     """
     Use Case para gerar relatório de estoque
-    
+
     Fluxo:
     1. Busca todos os medicamentos
-    2. Para cada medicamento, busca seus lotes
+    2. Agrega o estoque disponível de todos numa chamada só
     3. Calcula totais e estatísticas
     4. Identifica alertas (estoque baixo, produtos vencendo)
     5. Retorna relatório consolidado
@@ -41,27 +42,28 @@ class RelatorioEstoqueUseCase:
         """
         # 1. Buscar todos os medicamentos
         medicamentos = self.medicamento_repository.listar_todos()
-        
-        # 2. Preparar dados do relatório
+
+        # 2. Agregar o estoque disponível de TODOS numa chamada só:
+        # 2 idas ao repositório no relatório inteiro, em vez de 1
+        # busca de lotes por medicamento (o famoso N+1!) — no
+        # Postgres a agregação vira um único GROUP BY
+        hoje = date.today()
+        resumo_estoque = self.lote_repository.agregar_estoque_disponivel(hoje)
+
+        # Preparar dados do relatório
         itens_estoque = []
         total_produtos = 0
         total_unidades = 0
         valor_total = Decimal("0")
         produtos_abaixo_minimo = 0
         produtos_zerados = 0
-        
+
         for medicamento in medicamentos:
-            # Buscar lotes do medicamento
-            lotes = self.lote_repository.buscar_por_medicamento(medicamento.id)
-            
-            # Calcular estoque disponível (só lotes não vencidos)
-            from datetime import date
-            estoque_disponivel = sum(
-                lote.quantidade 
-                for lote in lotes 
-                if lote.data_validade > date.today()
+            # Estoque disponível já agregado (só lotes não vencidos)
+            estoque_disponivel, total_lotes = resumo_estoque.get(
+                medicamento.id, (0, 0)
             )
-            
+
             # Pular produtos zerados se não deve incluir
             if not incluir_zerados and estoque_disponivel == 0:
                 produtos_zerados += 1
@@ -80,21 +82,23 @@ class RelatorioEstoqueUseCase:
                 status = "OK"
                 prioridade = 3
             
-            # Calcular valor em estoque
-            valor_estoque = medicamento.preco * estoque_disponivel
-            
+            # Calcular valor em estoque (preco lido UMA vez pra local
+            # — era usado em 2 lugares no corpo do loop)
+            preco = medicamento.preco
+            valor_estoque = preco * estoque_disponivel
+
             # Adicionar item ao relatório
             item = {
                 "medicamento_id": medicamento.id,
                 "nome": medicamento.nome,
                 "principio_ativo": medicamento.principio_ativo,
-                "preco_unitario": float(medicamento.preco),
+                "preco_unitario": float(preco),
                 "estoque_atual": estoque_disponivel,
                 "estoque_minimo": medicamento.estoque_minimo,
                 "status": status,
                 "prioridade": prioridade,
                 "valor_em_estoque": float(valor_estoque),
-                "total_lotes": len(lotes)
+                "total_lotes": total_lotes
             }
             
             itens_estoque.append(item)
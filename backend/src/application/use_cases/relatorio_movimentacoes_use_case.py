@@ -41,39 +41,46 @@ class RelatorioMovimentacoesUseCase:
             Dicionário com relatório de movimentações
         """
         # 1. Calcular data inicial
-        data_inicial = date.today() - timedelta(days=dias)
-        
-        # 2. Buscar todos os lotes
-        # NOTA: Como não temos filtro por data no repositório,
-        # vamos buscar todos e filtrar em memória
-        todos_lotes = self.lote_repository.listar_todos()
-        
-        # Filtrar lotes do período (por data de fabricação)
-        lotes_periodo = [
-            lote for lote in todos_lotes
-            if lote.data_fabricacao >= data_inicial
-        ]
-        
-        # 3. Preparar dados de movimentações
+        hoje = date.today()
+        data_inicial = hoje - timedelta(days=dias)
+
+        # 2. Buscar os lotes do período — o filtro já foi empurrado
+        # pro repositório (no Postgres vira WHERE data_fabricacao >=
+        # ... com range scan no índice): só o período pedido trafega
+        lotes_periodo = self.lote_repository.listar_por_fabricacao_desde(
+            data_inicial
+        )
+
+        # 3. Buscar os nomes SÓ dos medicamentos referenciados, numa
+        # chamada só (SELECT ... IN) — nem 1 busca por lote (N+1),
+        # nem o catálogo inteiro
+        ids_medicamentos = {lote.medicamento_id for lote in lotes_periodo}
+        nomes_medicamentos = {
+            medicamento.id: medicamento.nome
+            for medicamento in self.medicamento_repository.buscar_por_ids(
+                ids_medicamentos
+            )
+        }
+
+        # 4. Preparar dados de movimentações
         movimentacoes = []
         total_entradas = 0
         total_saidas = 0
-        
+
         # Agrupar por medicamento
         medicamentos_dict = {}
-        
+
         for lote in lotes_periodo:
             medicamento_id = lote.medicamento_id
-            
+
             if medicamento_id not in medicamentos_dict:
-                # Buscar info do medicamento
-                medicamento = self.medicamento_repository.buscar_por_id(medicamento_id)
-                if not medicamento:
+                nome = nomes_medicamentos.get(medicamento_id)
+                if nome is None:
                     continue
-                
+
                 medicamentos_dict[medicamento_id] = {
                     "medicamento_id": medicamento_id,
-                    "nome": medicamento.nome,
+                    "nome": nome,
                     "entradas": 0,
                     "saidas": 0,
                     "saldo": 0,
@@ -100,14 +107,14 @@ class RelatorioMovimentacoesUseCase:
         for item in movimentacoes:
             item["saldo"] = item["entradas"] - item["saidas"]
         
-        # 4. Ordenar por nome
+        # 5. Ordenar por nome
         movimentacoes.sort(key=lambda x: x["nome"])
         
-        # 5. Montar relatório final
+        # 6. Montar relatório final
         relatorio = {
             "periodo": {
                 "data_inicial": data_inicial.isoformat(),
-                "data_final": date.today().isoformat(),
+                "data_final": hoje.isoformat(),
                 "dias": dias
             },
             "resumo": {
@@ -60,21 +60,22 @@ class VerificarEstoqueBaixoUseCase:
         """
         # 1. Buscar todos os medicamentos
         medicamentos = self.medicamento_repo.listar_todos()
-        
-        # 2. Lista para armazenar alertas
+
+        # 2. Agregar o estoque disponível de TODOS de uma vez:
+        # 2 chamadas ao repositório no total, em vez de 1 por
+        # medicamento (N+1) — no Postgres vira um único GROUP BY
+        hoje = datetime.now().date()
+        resumo_estoque = self.lote_repo.agregar_estoque_disponivel(hoje)
+
+        # 3. Lista para armazenar alertas
         alertas = []
-        
-        # 3. Verificar cada medicamento
+
+        # 4. Verificar cada medicamento
         for medicamento in medicamentos:
-            # Buscar lotes do medicamento
-            lotes = self.lote_repo.buscar_por_medicamento(medicamento.id)
-            
-            # Calcular estoque disponível (apenas lotes não vencidos)
-            estoque_disponivel = sum(
-                lote.quantidade for lote in lotes
-                if lote.data_validade > datetime.now().date()
-            )
-            
+            # Estoque disponível já agregado (apenas lotes não vencidos)
+            estoque_disponivel, _ = resumo_estoque.get(medicamento.id, (0, 0))
+
+
             # Verificar se está abaixo do mínimo ou zerado
             if estoque_disponivel == 0:
                 # CRÍTICO - zerado!
@@ -122,7 +123,7 @@ class VerificarEstoqueBaixoUseCase:
                     "prioridade": 2  # Alta prioridade
                 })
         
-        # 4. Ordenar por prioridade (crítico primeiro) e depois por diferença
+        # 5. Ordenar por prioridade (crítico primeiro) e depois por diferença
         alertas.sort(key=lambda x: (x["prioridade"], -x["diferenca"]))
         
         return alertas
\ No newline at end of file
@@ -9,10 +9,12 @@ from .estoque_events import (
     ProdutoVencendoEvent,
     EstoqueAtualizadoEvent
 )
+from .async_event_dispatcher import AsyncEventDispatcher
 
 __all__ = [
     "BaseEvent",
     "EstoqueBaixoEvent",
     "ProdutoVencendoEvent",
     "EstoqueAtualizadoEvent",
+    "AsyncEventDispatcher",
 ]
\ No newline at end of file
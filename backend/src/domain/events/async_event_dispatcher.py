@@ -0,0 +1,123 @@
+"""
+Async Event Dispatcher
+Despacha eventos numa thread de trabalho, fora do caminho do publicador
+Observer Pattern - versão assíncrona (opt-in)
+"""
+
+import queue
+import threading
+from typing import List
+
+from .base_event import BaseEvent
+from .estoque_events import EstoqueBaixoEvent
+from .event_dispatcher import EventDispatcher, event_dispatcher
+
+
+class AsyncEventDispatcher:
+    """
+    Despachante assíncrono de eventos
+
+    O publicador só faz um put() na fila (microssegundos) e segue a vida.
+    Uma thread daemon consome a fila e chama os observers de verdade —
+    se um observer futuro fizer I/O lento (email, SMS...), quem espera
+    é a thread de trabalho, não a lógica de negócio!
+
+    Bônus: eventos EstoqueBaixoEvent repetidos do MESMO medicamento
+    que se acumularam na fila são coalescidos — só o mais recente é
+    entregue (com um contador de quantos ele substituiu). Rajadas de
+    saída de estoque viram 1 alerta em vez de N.
+
+    Uso (opt-in — o padrão do projeto continua síncrono):
+        dispatcher = AsyncEventDispatcher()
+        dispatcher.publicar(evento)   # Não bloqueia!
+        dispatcher.aguardar()         # Espera a fila esvaziar (testes)
+    """
+
+    def __init__(self, dispatcher: EventDispatcher = None):
+        """
+        Inicializa fila e thread de trabalho
+
+        Args:
+            dispatcher: Despachante síncrono que entrega aos observers
+                        (padrão: o singleton event_dispatcher)
+        """
+        # Reusa o registro de observers do despachante síncrono
+        self._dispatcher = dispatcher or event_dispatcher
+        self._fila: "queue.Queue[BaseEvent]" = queue.Queue()
+
+        # daemon=True: a thread morre junto com o processo,
+        # sem segurar o shutdown
+        self._worker = threading.Thread(
+            target=self._processar,
+            name="async-event-dispatcher",
+            daemon=True
+        )
+        self._worker.start()
+
+    def publicar(self, evento: BaseEvent):
+        """
+        Publica um evento (não bloqueia!)
+
+        Args:
+            evento: Evento a despachar na thread de trabalho
+        """
+        self._fila.put(evento)
+
+    def aguardar(self):
+        """Bloqueia até todos os eventos publicados serem processados"""
+        self._fila.join()
+
+    def _processar(self):
+        """Loop da thread de trabalho: drena, coalesce, entrega"""
+        while True:
+            # Bloqueia esperando o primeiro evento...
+            eventos = [self._fila.get()]
+
+            # ...e drena o que mais já estiver na fila (a rajada
+            # acumulada É a janela de coalescência)
+            try:
+                while True:
+                    eventos.append(self._fila.get_nowait())
+            except queue.Empty:
+                pass
+
+            # Entrega a rajada inteira de uma vez: o despachante
+            # agrupa por tipo e os observers amortizam o I/O
+            self._dispatcher.notificar_em_lote(self._coalescer(eventos))
+
+            # 1 task_done por get() — é isso que aguardar() espera
+            for _ in eventos:
+                self._fila.task_done()
+
+    @staticmethod
+    def _coalescer(eventos: List[BaseEvent]) -> List[BaseEvent]:
+        """
+        Coalesce EstoqueBaixoEvent repetidos do mesmo medicamento
+
+        O evento mais novo substitui o antigo NA MESMA posição
+        (preserva a ordem relativa) e ganha o contador `coalescidos`.
+        Outros tipos de evento passam intocados.
+
+        Args:
+            eventos: Rajada drenada da fila, em ordem de publicação
+
+        Returns:
+            Lista de eventos a entregar
+        """
+        resultado: List[BaseEvent] = []
+        posicao_por_medicamento = {}  # medicamento_id -> índice em resultado
+
+        for evento in eventos:
+            if isinstance(evento, EstoqueBaixoEvent):
+                posicao = posicao_por_medicamento.get(evento.medicamento_id)
+                if posicao is not None:
+                    # Substitui o antigo e acumula o contador
+                    anterior = resultado[posicao]
+                    evento.coalescidos = getattr(anterior, "coalescidos", 1) + 1
+                    resultado[posicao] = evento
+                    continue
+                posicao_por_medicamento[evento.medicamento_id] = len(resultado)
+
+            resultado.append(evento)
+
+        return resultado
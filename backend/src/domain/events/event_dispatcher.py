@@ -89,6 +89,50 @@ class EventDispatcher:
                 # Se 1 observer falhar, não para os outros!
                 print(f"❌ Erro ao notificar {observer.__class__.__name__}: {e}")
     
+    def notificar_em_lote(self, eventos: List[BaseEvent]):
+        """
+        Notifica observers sobre uma rajada de eventos de uma vez
+
+        Agrupa os eventos por tipo e entrega o lote inteiro a cada
+        observer (notificar_em_lote): o custo fixo por notificação
+        (lookup de observers, prints, escrita de log) é pago 1 vez
+        por lote em vez de 1 vez por evento!
+
+        Args:
+            eventos: Eventos a despachar, em ordem de chegada
+        """
+        if not eventos:
+            return
+
+        # Agrupa por tipo preservando a ordem de chegada
+        por_tipo: Dict[Type[BaseEvent], List[BaseEvent]] = {}
+        for evento in eventos:
+            por_tipo.setdefault(type(evento), []).append(evento)
+
+        for tipo_evento, lote in por_tipo.items():
+            observers = self._observers.get(tipo_evento, [])
+
+            if not observers:
+                print(f"⚠️ Nenhum observer registrado para {tipo_evento.__name__}")
+                continue
+
+            print(f"📢 Notificando {len(observers)} observer(s) "
+                  f"sobre {len(lote)} {tipo_evento.__name__}")
+
+            for observer in observers:
+                try:
+                    # Observers fora da hierarquia BaseObserver
+                    # (ex: mocks de teste) podem não ter o método em lote
+                    em_lote = getattr(observer, "notificar_em_lote", None)
+                    if em_lote is not None:
+                        em_lote(lote)
+                    else:
+                        for evento in lote:
+                            observer.notificar(evento)
+                except Exception as e:
+                    # Se 1 observer falhar, não para os outros!
+                    print(f"❌ Erro ao notificar {observer.__class__.__name__}: {e}")
+
     def limpar(self):
         """Limpa todos os observers (útil pra testes)"""
         self._observers.clear()
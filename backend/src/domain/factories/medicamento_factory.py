@@ -3,8 +3,9 @@ Factory Pattern: Medicamento Factory
 Cria medicamentos de forma padronizada com validações
 """
 
+from datetime import date
 from decimal import Decimal
-from typing import Optional
+from typing import Optional, Union
 
 from src.domain.entities import Medicamento, Lote
 
@@ -84,30 +85,28 @@ class MedicamentoFactory:
         preco: float,
         numero_lote: str,
         quantidade_inicial: int,
-        data_fabricacao: str,
-        data_validade: str,
+        data_fabricacao: Union[date, str],
+        data_validade: Union[date, str],
         fornecedor: str,
         estoque_minimo: Optional[int] = None,
         controlado: bool = False
     ) -> tuple[Medicamento, Lote]:
         """
         Cria medicamento JÁ COM lote inicial
-        
+
         Útil quando está cadastrando produto novo que já chegou!
-        
+
         Args:
             [medicamento args...]
             numero_lote: Número do lote
             quantidade_inicial: Quantidade no lote
-            data_fabricacao: Data de fabricação (YYYY-MM-DD)
-            data_validade: Data de validade (YYYY-MM-DD)
+            data_fabricacao: Data de fabricação (date ou "YYYY-MM-DD")
+            data_validade: Data de validade (date ou "YYYY-MM-DD")
             fornecedor: Nome do fornecedor
-            
+
         Returns:
             Tupla (medicamento, lote)
         """
-        from datetime import date
-        
         # 1. Criar medicamento
         medicamento = cls.criar(
             nome=nome,
@@ -121,10 +120,18 @@ class MedicamentoFactory:
         if quantidade_inicial <= 0:
             raise ValueError("Quantidade inicial deve ser maior que zero")
         
-        # 3. Converter datas
+        # 3. Converter datas — se já vier date (a API valida com
+        # Pydantic e entrega date pronto!), usa direto, sem o
+        # vai-e-volta isoformat() → fromisoformat()
         try:
-            data_fab = date.fromisoformat(data_fabricacao)
-            data_val = date.fromisoformat(data_validade)
+            data_fab = (
+                data_fabricacao if isinstance(data_fabricacao, date)
+                else date.fromisoformat(data_fabricacao)
+            )
+            data_val = (
+                data_validade if isinstance(data_validade, date)
+                else date.fromisoformat(data_validade)
+            )
         except (ValueError, TypeError) as e:
             raise ValueError(f"Formato de data inválido: {e}")
         
@@ -5,7 +5,7 @@ Define o "contrato" para persistência de Lotes
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Dict, Iterator, Optional, List, Tuple
 from datetime import date
 from ..entities import Lote
 
@@ -13,6 +13,10 @@ from ..entities import Lote
 class LoteRepositoryPort(ABC):
     """Interface para operações de persistência de Lotes"""
     
+    # __slots__ vazio na base: se a ABC não declarar, toda subclasse
+    # com __slots__ ganharia __dict__ mesmo assim e o ganho sumiria!
+    __slots__ = ()
+    
     @abstractmethod
     def salvar(self, lote: Lote) -> Lote:
         """
@@ -25,7 +29,23 @@ class LoteRepositoryPort(ABC):
             Lote salvo (com ID preenchido)
         """
         pass
-    
+
+    def salvar_em_lote(self, lotes: List[Lote]) -> List[Lote]:
+        """
+        Salva vários lotes de uma vez
+
+        Implementação padrão: chama salvar() um a um.
+        Adapters de banco podem sobrescrever com INSERT em lote
+        (1 round-trip pra N linhas em vez de N commits)!
+
+        Args:
+            lotes: Lista de lotes a salvar
+
+        Returns:
+            Lista de lotes salvos (com IDs preenchidos)
+        """
+        return [self.salvar(lote) for lote in lotes]
+
     @abstractmethod
     def buscar_por_id(self, id: int) -> Optional[Lote]:
         """
@@ -48,7 +68,20 @@ class LoteRepositoryPort(ABC):
             Lista de lotes (pode ser vazia)
         """
         pass
-    
+
+    def iterar_todos(self) -> Iterator[Lote]:
+        """
+        Itera sobre todos os lotes, um de cada vez
+
+        Implementação padrão: itera sobre listar_todos().
+        Adapters de banco podem sobrescrever com cursor streaming
+        (memória constante mesmo com milhões de linhas)!
+
+        Returns:
+            Iterador de lotes
+        """
+        return iter(self.listar_todos())
+
     @abstractmethod
     def buscar_por_medicamento(self, medicamento_id: int) -> List[Lote]:
         """
@@ -62,6 +95,70 @@ class LoteRepositoryPort(ABC):
         """
         pass
     
+    def somar_quantidade_por_medicamento(self, medicamento_id: int) -> int:
+        """
+        Soma a quantidade total em estoque de um medicamento
+
+        Implementação padrão: soma sobre buscar_por_medicamento().
+        Adapters de banco podem sobrescrever com SELECT SUM(...)
+        (1 escalar na rede em vez de N linhas hidratadas)!
+
+        Args:
+            medicamento_id: ID do medicamento
+
+        Returns:
+            Quantidade total somada (0 se não houver lotes)
+        """
+        return sum(
+            lote.quantidade
+            for lote in self.buscar_por_medicamento(medicamento_id)
+        )
+
+    def buscar_disponiveis_fifo(self, medicamento_id: int) -> List[Lote]:
+        """
+        Busca lotes disponíveis de um medicamento em ordem FIFO
+
+        Disponível = não vencido E com quantidade > 0.
+        Ordenado por data de fabricação (mais antigo primeiro).
+
+        Implementação padrão: filtra e ordena em Python.
+        Adapters de banco podem sobrescrever empurrando o filtro
+        e o ORDER BY pro banco (menos linhas na rede, sem sort
+        em Python)!
+
+        Args:
+            medicamento_id: ID do medicamento
+
+        Returns:
+            Lotes disponíveis, do mais antigo pro mais novo
+        """
+        disponiveis = [
+            lote for lote in self.buscar_por_medicamento(medicamento_id)
+            if not lote.esta_vencido() and lote.quantidade > 0
+        ]
+        disponiveis.sort(key=lambda lote: lote.data_fabricacao)
+        return disponiveis
+
+    def listar_por_fabricacao_desde(self, data_inicial: date) -> List[Lote]:
+        """
+        Lista lotes fabricados a partir de uma data
+
+        Implementação padrão: filtra em Python sobre iterar_todos().
+        Adapters de banco podem sobrescrever empurrando o predicado
+        pro banco (WHERE data_fabricacao >= ...) — trafega só o
+        período pedido, não a tabela inteira!
+
+        Args:
+            data_inicial: Data mínima de fabricação (inclusive)
+
+        Returns:
+            Lotes fabricados em data_inicial ou depois
+        """
+        return [
+            lote for lote in self.iterar_todos()
+            if lote.data_fabricacao >= data_inicial
+        ]
+
     @abstractmethod
     def listar_vencendo_em(self, dias: int) -> List[Lote]:
         """
@@ -75,6 +172,34 @@ class LoteRepositoryPort(ABC):
         """
         pass
     
+    def agregar_estoque_disponivel(
+        self, data_ref: date
+    ) -> Dict[int, Tuple[int, int]]:
+        """
+        Agrega o estoque disponível de TODOS os medicamentos de uma vez
+
+        Disponível = quantidade dos lotes com validade após data_ref.
+        Uma chamada responde pelo catálogo inteiro — relatórios deixam
+        de fazer 1 consulta por medicamento (o famoso N+1)!
+
+        Implementação padrão: uma varredura nos lotes.
+        Adapters de banco podem sobrescrever com GROUP BY
+        (1 round-trip, agregação feita pelo banco).
+
+        Args:
+            data_ref: Data de referência pra considerar vencimento
+
+        Returns:
+            Dicionário medicamento_id → (estoque_disponivel, total_lotes)
+        """
+        resumo: Dict[int, Tuple[int, int]] = {}
+        for lote in self.iterar_todos():
+            disponivel, total_lotes = resumo.get(lote.medicamento_id, (0, 0))
+            if lote.data_validade > data_ref:
+                disponivel += lote.quantidade
+            resumo[lote.medicamento_id] = (disponivel, total_lotes + 1)
+        return resumo
+
     @abstractmethod
     def atualizar(self, lote: Lote) -> Lote:
         """
@@ -91,6 +216,25 @@ class LoteRepositoryPort(ABC):
         """
         pass
     
+    def atualizar_muitos(self, lotes: List[Lote]) -> List[Lote]:
+        """
+        Atualiza vários lotes de uma vez
+
+        Implementação padrão: chama atualizar() um a um.
+        Adapters de banco podem sobrescrever com UPDATE em lote
+        (1 round-trip pra N lotes em vez de N UPDATEs)!
+
+        Args:
+            lotes: Lotes com dados atualizados
+
+        Returns:
+            Lista de lotes atualizados
+
+        Raises:
+            ValueError: Se algum lote não existir
+        """
+        return [self.atualizar(lote) for lote in lotes]
+
     @abstractmethod
     def deletar(self, id: int) -> bool:
         """
@@ -102,4 +246,20 @@ class LoteRepositoryPort(ABC):
         Returns:
             True se deletou, False se não encontrou
         """
-        pass
\ No newline at end of file
+        pass
+
+    def deletar_em_lote(self, ids: List[int]) -> int:
+        """
+        Deleta vários lotes de uma vez
+
+        Implementação padrão: chama deletar() um a um.
+        Adapters de banco podem sobrescrever com um único
+        DELETE ... WHERE id IN (...)!
+
+        Args:
+            ids: IDs dos lotes a deletar
+
+        Returns:
+            Quantidade de lotes efetivamente deletados
+        """
+        return sum(1 for id in ids if self.deletar(id))
\ No newline at end of file
@@ -6,7 +6,7 @@ Este é um PORT - uma interface abstrata que será implementada pelos Adapters
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 from ..entities import Medicamento
 
 
@@ -19,6 +19,10 @@ class MedicamentoRepositoryPort(ABC):
     sem afetar o resto do código!
     """
     
+    # __slots__ vazio na base: se a ABC não declarar, toda subclasse
+    # com __slots__ ganharia __dict__ mesmo assim e o ganho sumiria!
+    __slots__ = ()
+    
     @abstractmethod
     def salvar(self, medicamento: Medicamento) -> Medicamento:
         """
@@ -31,7 +35,23 @@ class MedicamentoRepositoryPort(ABC):
             Medicamento salvo (com ID preenchido)
         """
         pass
-    
+
+    def salvar_em_lote(self, medicamentos: list[Medicamento]) -> list[Medicamento]:
+        """
+        Salva vários medicamentos de uma vez
+
+        Implementação padrão: chama salvar() um a um.
+        Adapters de banco podem sobrescrever com INSERT em lote
+        (1 round-trip pra N linhas em vez de N commits)!
+
+        Args:
+            medicamentos: Lista de medicamentos a salvar
+
+        Returns:
+            Lista de medicamentos salvos (com IDs preenchidos)
+        """
+        return [self.salvar(medicamento) for medicamento in medicamentos]
+
     @abstractmethod
     def buscar_por_id(self, id: int) -> Optional[Medicamento]:
         """
@@ -45,6 +65,24 @@ class MedicamentoRepositoryPort(ABC):
         """
         pass
     
+    def buscar_por_ids(self, ids: Iterable[int]) -> list[Medicamento]:
+        """
+        Busca vários medicamentos de uma vez
+
+        Implementação padrão: chama buscar_por_id() um a um.
+        Adapters de banco podem sobrescrever com um único
+        SELECT ... WHERE id IN (...) — 1 round-trip pra N IDs!
+
+        Args:
+            ids: IDs dos medicamentos a buscar
+
+        Returns:
+            Lista dos medicamentos encontrados (IDs inexistentes
+            são simplesmente omitidos)
+        """
+        encontrados = (self.buscar_por_id(id) for id in ids)
+        return [medicamento for medicamento in encontrados if medicamento]
+
     @abstractmethod
     def listar_todos(self) -> list[Medicamento]:
         """
@@ -54,7 +92,20 @@ class MedicamentoRepositoryPort(ABC):
             Lista de medicamentos (pode ser vazia)
         """
         pass
-    
+
+    def iterar_todos(self) -> Iterator[Medicamento]:
+        """
+        Itera sobre todos os medicamentos, um de cada vez
+
+        Implementação padrão: itera sobre listar_todos().
+        Adapters de banco podem sobrescrever com cursor streaming
+        (memória constante mesmo com milhões de linhas)!
+
+        Returns:
+            Iterador de medicamentos
+        """
+        return iter(self.listar_todos())
+
     @abstractmethod
     def atualizar(self, medicamento: Medicamento) -> Medicamento:
         """
@@ -82,4 +133,20 @@ class MedicamentoRepositoryPort(ABC):
         Returns:
             True se deletou, False se não encontrou
         """
-        pass
\ No newline at end of file
+        pass
+
+    def deletar_em_lote(self, ids: list[int]) -> int:
+        """
+        Deleta vários medicamentos de uma vez
+
+        Implementação padrão: chama deletar() um a um.
+        Adapters de banco podem sobrescrever com um único
+        DELETE ... WHERE id IN (...)!
+
+        Args:
+            ids: IDs dos medicamentos a deletar
+
+        Returns:
+            Quantidade de medicamentos efetivamente deletados
+        """
+        return sum(1 for id in ids if self.deletar(id))
\ No newline at end of file
@@ -3,6 +3,8 @@ Configuração de Observers
 Registra observers no event dispatcher
 """
 
+import logging
+
 from src.domain.events import EstoqueBaixoEvent, ProdutoVencendoEvent
 from src.domain.events.event_dispatcher import event_dispatcher
 from src.adapters.observers import (
@@ -18,7 +20,11 @@ def configurar_observers():
     Chamado na inicialização da aplicação
     """
     print("\n🔧 Configurando observers...")
-    
+
+    # 0. Os observers emitem alertas via logging (1 write por alerta,
+    # em vez de um print por linha) — garantir que INFO aparece no console
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     # 1. Criar instâncias dos observers
     estoque_baixo_obs = EstoqueBaixoObserver(nome_gerente="Gerente AlleFarma")
     produto_vencendo_obs = ProdutoVencendoObserver(dias_alerta_critico=7)
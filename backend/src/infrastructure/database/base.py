@@ -21,9 +21,22 @@ DATABASE_URL = os.getenv(
 )
 
 # Criar engine do SQLAlchemy
+# Pool dimensionado pra carga real (os padrões — 5 conexões — travam
+# em rajada!). Tudo ajustável via .env sem mexer no código:
 engine = create_engine(
     DATABASE_URL,
-    echo=False  # True para ver SQL no terminal (útil pra debug)
+    echo=False,  # True para ver SQL no terminal (útil pra debug)
+    # Conexões mantidas abertas no pool
+    pool_size=int(os.getenv("DB_POOL_SIZE", "20")),
+    # Conexões extras permitidas em pico (além do pool_size)
+    max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "10")),
+    # Quanto tempo esperar por conexão livre antes de estourar erro
+    pool_timeout=int(os.getenv("DB_POOL_TIMEOUT", "30")),
+    # Testa a conexão antes de usar: conexão morta (banco reiniciou,
+    # firewall derrubou) é descartada em vez de virar erro no request
+    pool_pre_ping=True,
+    # Recicla conexões com mais de 1h (evita timeout do servidor)
+    pool_recycle=3600
 )
 
 # Criar fábrica de sessões
@@ -41,10 +54,28 @@ def get_session():
     """
     Dependency Injection do FastAPI
 
-    Cria uma sessão, passa pro endpoint, fecha no final.
+    Cria uma sessão, passa pro endpoint e faz UM commit no final
+    da requisição (unit of work). Os repositórios só dão flush() —
+    assim N escritas no mesmo request viram 1 fsync só, em vez de
+    um commit (= uma espera de disco) por operação.
+
+    Se o endpoint estourar exceção, desfaz tudo com rollback.
+
+    NOTA sobre async: os endpoints são "def" síncronos de propósito.
+    O FastAPI roda handlers síncronos num threadpool, então a espera
+    de banco NÃO trava o event loop. Migrar pra async de verdade
+    exigiria AsyncSession + driver asyncpg e versões async de TODOS
+    os repositórios — ganho real só aparece com concorrência acima
+    do tamanho do threadpool. Se chegar lá, o caminho é
+    async_sessionmaker(create_async_engine(...)) espelhando esta
+    fábrica.
     """
     db = SessionLocal()
     try:
         yield db
+        db.commit()  # Commit único no fim do request
+    except Exception:
+        db.rollback()
+        raise
     finally:
         db.close()
\ No newline at end of file
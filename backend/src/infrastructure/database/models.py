@@ -3,24 +3,49 @@ Modelos SQLAlchemy (Tabelas do Banco)
 Representam as tabelas no PostgreSQL
 """
 
-from sqlalchemy import Column, Integer, String, Date, ForeignKey
+from sqlalchemy import Column, Index, Integer, Numeric, String, Date, ForeignKey, text
 from .base import Base
 
 
 class LoteModel(Base):
     """
     Modelo (Tabela) de Lote no banco de dados
-    
+
     Esta classe vira uma TABELA no PostgreSQL!
     """
     __tablename__ = "lotes"
-    
+
+    # Índice composto pro consumo FIFO: buscar_disponiveis_fifo vira
+    # um index scan que já devolve as linhas ordenadas — sem sort.
+    # Parcial (quantidade > 0): lote esgotado nem entra no índice!
+    #
+    # Índice de validade COBRINDO medicamento_id e quantidade:
+    # a janela "vencendo até dia X" resolve como index-only scan
+    # (o Postgres nem toca na tabela pra agregar quantidade)
+    __table_args__ = (
+        Index(
+            "ix_lotes_fifo",
+            "medicamento_id",
+            "data_fabricacao",
+            postgresql_where=text("quantidade > 0")
+        ),
+        Index(
+            "ix_lotes_validade",
+            "data_validade",
+            postgresql_include=["medicamento_id", "quantidade"]
+        ),
+        # Range scan do relatório de movimentações
+        # (WHERE data_fabricacao >= período)
+        Index("ix_lotes_data_fabricacao", "data_fabricacao"),
+    )
+
     # Colunas
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     numero_lote = Column(String(100), nullable=False, unique=True)
     medicamento_id = Column(Integer, ForeignKey("medicamentos.id"), nullable=False)
     quantidade = Column(Integer, nullable=False)
     data_fabricacao = Column(Date, nullable=False)
+    # Range scan de validade usa o ix_lotes_validade (ver acima)
     data_validade = Column(Date, nullable=False)
     fornecedor = Column(String(200), nullable=False)
     
@@ -38,7 +63,9 @@ class MedicamentoModel(Base):
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     nome = Column(String(200), nullable=False)
     principio_ativo = Column(String(200), nullable=False)
-    preco = Column(String(20), nullable=False)  # Decimal vira String
+    # NUMERIC de verdade: o driver entrega Decimal direto,
+    # sem o vai-e-volta str(Decimal) ↔ Decimal(str) por linha
+    preco = Column(Numeric(10, 2), nullable=False)
     estoque_minimo = Column(Integer, nullable=False)
     descricao = Column(String(500), nullable=True)
     estoque_atual = Column(Integer, default=0)
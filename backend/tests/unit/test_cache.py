@@ -0,0 +1,70 @@
+"""
+Testes Unitários: Cache de Respostas (TTL)
+Testa o CacheTTL usado pelos controllers de relatórios
+"""
+
+import time
+
+from src.api.cache import CacheTTL
+
+
+class TestCacheTTL:
+    """Testes para o cache TTL em memória"""
+
+    def test_guarda_e_recupera_valor(self):
+        """✅ Deve devolver o valor guardado enquanto o TTL vale"""
+        cache = CacheTTL(ttl_segundos=60)
+
+        cache.guardar("relatorios:estoque:False", {"total": 10})
+
+        assert cache.obter("relatorios:estoque:False") == {"total": 10}
+
+    def test_valor_expira_apos_ttl(self):
+        """✅ Deve devolver None depois que o TTL expira"""
+        cache = CacheTTL(ttl_segundos=0.01)
+
+        cache.guardar("chave", "valor")
+        time.sleep(0.02)
+
+        assert cache.obter("chave") is None
+
+    def test_chave_inexistente_devolve_none(self):
+        """✅ Deve devolver None pra chave nunca guardada"""
+        cache = CacheTTL()
+
+        assert cache.obter("nao-existe") is None
+
+    def test_invalidar_por_prefixo(self):
+        """✅ Deve remover só as chaves do prefixo informado"""
+        cache = CacheTTL(ttl_segundos=60)
+        cache.guardar("relatorios:estoque:False", 1)
+        cache.guardar("relatorios:vencendo:30", 2)
+        cache.guardar("medicamentos:lista", 3)
+
+        cache.invalidar("relatorios:")
+
+        assert cache.obter("relatorios:estoque:False") is None
+        assert cache.obter("relatorios:vencendo:30") is None
+        assert cache.obter("medicamentos:lista") == 3
+
+    def test_invalidar_tudo(self):
+        """✅ Deve limpar o cache inteiro sem prefixo"""
+        cache = CacheTTL(ttl_segundos=60)
+        cache.guardar("a", 1)
+        cache.guardar("b", 2)
+
+        cache.invalidar()
+
+        assert cache.obter("a") is None
+        assert cache.obter("b") is None
+
+    def test_contadores_de_acerto_e_falta(self):
+        """✅ Deve contar acertos e faltas das consultas"""
+        cache = CacheTTL(ttl_segundos=60)
+        cache.guardar("chave", "valor")
+
+        cache.obter("chave")       # acerto
+        cache.obter("nao-existe")  # falta
+
+        assert cache.acertos == 1
+        assert cache.faltas == 1
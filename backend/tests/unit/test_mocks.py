@@ -272,6 +272,7 @@ class TestAdicionarEstoqueComMock:
 
         repo_med_mock.buscar_por_id.return_value = medicamento_fake
         repo_lotes_mock.salvar.return_value = lote_fake
+        repo_lotes_mock.somar_quantidade_por_medicamento.return_value = 100
 
         use_case = AdicionarEstoqueUseCase(repo_med_mock, repo_lotes_mock)
 
@@ -301,6 +302,7 @@ class TestAdicionarEstoqueComMock:
 
         repo_med_mock.buscar_por_id.return_value = medicamento_fake
         repo_lotes_mock.salvar.return_value = lote_fake
+        repo_lotes_mock.somar_quantidade_por_medicamento.return_value = 100
 
         use_case = AdicionarEstoqueUseCase(repo_med_mock, repo_lotes_mock)
 
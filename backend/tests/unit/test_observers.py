@@ -7,7 +7,11 @@ Aula 13 - Testes Unitários
 
 import pytest
 
-from src.domain.events import EstoqueBaixoEvent, ProdutoVencendoEvent
+from src.domain.events import (
+    AsyncEventDispatcher,
+    EstoqueBaixoEvent,
+    ProdutoVencendoEvent
+)
 from src.domain.events.event_dispatcher import EventDispatcher
 from src.adapters.observers import (
     EstoqueBaixoObserver,
@@ -194,6 +198,29 @@ class TestEventDispatcher:
         # Observer de EstoqueBaixo NÃO deve ter sido notificado!
         assert len(notificacoes) == 0
 
+    def test_notificar_em_lote_agrupa_por_tipo(self, dispatcher_limpo):
+        """✅ Rajada mista deve ser agrupada por tipo de evento"""
+        lotes_recebidos = []
+
+        class ObserverTeste:
+            def notificar(self, evento):
+                pass
+
+            def notificar_em_lote(self, eventos):
+                lotes_recebidos.append(eventos)
+
+        dispatcher_limpo.registrar(EstoqueBaixoEvent, ObserverTeste())
+
+        eventos = [
+            EstoqueBaixoEvent(1, "Dipirona", estoque_atual=5, estoque_minimo=50),
+            EstoqueBaixoEvent(2, "Rivotril", estoque_atual=3, estoque_minimo=20),
+        ]
+        dispatcher_limpo.notificar_em_lote(eventos)
+
+        # 1 chamada com o lote inteiro (não 2 chamadas de 1)
+        assert len(lotes_recebidos) == 1
+        assert len(lotes_recebidos[0]) == 2
+
     def test_limpar_remove_todos_observers(self, dispatcher_limpo):
         """✅ limpar() deve remover todos os observers"""
         dispatcher_limpo.registrar(EstoqueBaixoEvent, EstoqueBaixoObserver())
@@ -205,6 +232,69 @@ class TestEventDispatcher:
         assert len(observers) == 0
 
 
+# ==========================================
+# TESTES: AsyncEventDispatcher
+# ==========================================
+
+class TestAsyncEventDispatcher:
+    """Testes para o despachante assíncrono"""
+
+    def test_publicar_entrega_na_thread_de_trabalho(self, dispatcher_limpo):
+        """✅ Evento publicado deve chegar no observer"""
+        notificacoes = []
+
+        class ObserverTeste:
+            def notificar(self, evento):
+                notificacoes.append(evento)
+
+        dispatcher_limpo.registrar(EstoqueBaixoEvent, ObserverTeste())
+        async_dispatcher = AsyncEventDispatcher(dispatcher_limpo)
+
+        evento = EstoqueBaixoEvent(
+            medicamento_id=1,
+            nome_medicamento="Dipirona",
+            estoque_atual=5,
+            estoque_minimo=50
+        )
+        async_dispatcher.publicar(evento)
+        async_dispatcher.aguardar()  # Espera a fila esvaziar
+
+        assert len(notificacoes) == 1
+        assert notificacoes[0].medicamento_id == 1
+
+    def test_coalescer_rajada_do_mesmo_medicamento(self):
+        """✅ Eventos repetidos do mesmo medicamento viram 1 só"""
+        eventos = [
+            EstoqueBaixoEvent(1, "Dipirona", estoque_atual=9, estoque_minimo=50),
+            EstoqueBaixoEvent(2, "Rivotril", estoque_atual=3, estoque_minimo=20),
+            EstoqueBaixoEvent(1, "Dipirona", estoque_atual=8, estoque_minimo=50),
+            EstoqueBaixoEvent(1, "Dipirona", estoque_atual=7, estoque_minimo=50),
+        ]
+
+        resultado = AsyncEventDispatcher._coalescer(eventos)
+
+        # 4 eventos viram 2 (1 por medicamento)
+        assert len(resultado) == 2
+        # O mais RECENTE do medicamento 1 sobrevive, na posição original
+        assert resultado[0].medicamento_id == 1
+        assert resultado[0].estoque_atual == 7
+        assert resultado[0].coalescidos == 3
+        assert resultado[1].medicamento_id == 2
+
+    def test_coalescer_nao_mexe_em_outros_eventos(self):
+        """✅ Outros tipos de evento passam intocados"""
+        eventos = [
+            ProdutoVencendoEvent(1, "Rivotril", 1, "LOT123",
+                                 "2026-02-20", 4, 30),
+            ProdutoVencendoEvent(1, "Rivotril", 2, "LOT456",
+                                 "2026-02-25", 9, 10),
+        ]
+
+        resultado = AsyncEventDispatcher._coalescer(eventos)
+
+        assert len(resultado) == 2
+
+
 # ==========================================
 # TESTES: EstoqueBaixoObserver
 # ==========================================
@@ -236,4 +326,16 @@ class TestEstoqueBaixoObserver:
         )
 
         # Não deve lançar exceção!
-        observer.notificar(evento)
\ No newline at end of file
+        observer.notificar(evento)
+
+    def test_observer_processa_lote_sem_erro(self):
+        """✅ Deve processar rajada de eventos sem lançar exceção"""
+        observer = EstoqueBaixoObserver(nome_gerente="Teste")
+
+        eventos = [
+            EstoqueBaixoEvent(1, "Dipirona", estoque_atual=5, estoque_minimo=50),
+            EstoqueBaixoEvent(2, "Rivotril", estoque_atual=2, estoque_minimo=20),
+        ]
+
+        # Não deve lançar exceção!
+        observer.notificar_em_lote(eventos)
\ No newline at end of file